@@ -1,31 +1,187 @@
 from intermediate import IntermediateCodeGenerator
 from semantic import SemanticAnalyzer
 from optimizer import Optimizer 
-from parser import parse, lexer, tokens as parser_ply_tokens, reserved as parser_reserved_keywords
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-import sys
-import os
+from parser import parse
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+import functools
+import re
+import threading
+import orjson
 from output_formatter import (
     format_synbl,
     format_typel,
     format_pfinfl,
     format_ainfl,
     format_consl,
-    format_keyword_table,
-    format_delimiter_table,
     format_identifier_table,
     format_constant_table,
     format_token_sequence,
     format_intermediate_code,
     format_optimized_code
 )
+from token_tables import (
+    KEYWORD_TABLE_STR,
+    DELIMITER_TABLE_STR,
+    collect_identifiers_and_constants,
+    transform_token_sequence
+)
+
+# Pipeline stages are created once per worker thread and reused across requests.
+# The analyzer is reset before each run; the generator and optimizer reset their
+# own state at the start of generate()/optimize().
+_pipeline = threading.local()
+
+def _get_pipeline():
+    if not hasattr(_pipeline, 'analyzer'):
+        _pipeline.analyzer = SemanticAnalyzer()
+        _pipeline.generator = IntermediateCodeGenerator()
+        _pipeline.optimizer = Optimizer()
+    return _pipeline
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Largest program (in characters) the API will compile; the formatted tables
+# grow with the program, so oversized pastes are refused up front.
+MAX_PROGRAM_SIZE = 256 * 1024
+
+# Every program the grammar accepts has 'program', 'begin' and 'end' in this
+# order; input without them is rejected before running the lexer and parser.
+# Each word is searched for from where the previous one ended, which stays
+# linear in the input; one pattern joined with '.*' backtracks polynomially
+# on input repeating the first words without the last.
+_PROGRAM_SHAPE_WORDS = tuple(re.compile(rf'\b{word}\b', re.IGNORECASE) for word in ('program', 'begin', 'end'))
+
+def _has_program_shape(program):
+    """Returns whether 'program', 'begin' and 'end' occur in program in this order."""
+    pos = 0
+    for word_re in _PROGRAM_SHAPE_WORDS:
+        match = word_re.search(program, pos)
+        if match is None:
+            return False
+        pos = match.end()
+    return True
+
+SYNTAX_ERROR_HINT = ' Please check your Pascal code for correct structure (e.g., program declaration, begin/end blocks).'
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Routes Flask's own JSON handling (request.get_json, jsonify) through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        # orjson has no indent/sort_keys options; responses are always compact.
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-# Adjust the path to import from the same directory
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 app = Flask(__name__)
-CORS(app, resources={r"/compile": {"origins": "*"}}, supports_credentials=True)
+app.json = OrjsonProvider(app)
+
+# CORS policy for /compile: any origin, with credentials (the frontend sends
+# credentials: 'include', so the request's Origin is echoed back rather than '*').
+# The policy never changes, so the headers are static and preflights are
+# answered by Flask's automatic OPTIONS response without running the view.
+CORS_PREFLIGHT_HEADERS = {
+    'Access-Control-Allow-Methods': 'POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+}
+
+@app.after_request
+def add_cors_headers(response):
+    origin = request.headers.get('Origin')
+    if origin and request.path == '/compile':
+        response.headers['Access-Control-Allow-Origin'] = origin
+        response.headers['Access-Control-Allow-Credentials'] = 'true'
+        response.vary.add('Origin')
+        if request.method == 'OPTIONS':
+            response.headers.update(CORS_PREFLIGHT_HEADERS)
+    return response
+
+
+def _compile_sections(program):
+    """
+    Runs the full pipeline for one program, yielding (section_name, text) pairs
+    as soon as each section is ready. A syntax error yields a single 'error' section.
+    """
+    # Step 1 & 2: Lexical Analysis and Parsing
+    # The parse function from parser.py returns both collected tokens and the AST.
+    raw_tokens_from_parser, ast = parse(program)
+
+    if ast is None:
+        if not raw_tokens_from_parser:
+            error_msg = "Parsing failed: No tokens generated and no AST."
+        else:  # Tokens exist but parsing failed
+            error_msg = "Invalid program syntax. AST could not be constructed."
+        yield 'error', error_msg + SYNTAX_ERROR_HINT
+        return
+
+    # --- Token tables and the transformed token sequence (shared with main.py) ---
+    unique_identifiers_list, unique_constants_list = collect_identifiers_and_constants(raw_tokens_from_parser)
+    transformed_token_sequence_output = transform_token_sequence(
+        raw_tokens_from_parser, unique_identifiers_list, unique_constants_list)
+
+    # Format the token sequence string with newlines (e.g., 10 tokens per line)
+    yield 'tokens', format_token_sequence(transformed_token_sequence_output)
+    yield 'keywordTable', KEYWORD_TABLE_STR
+    yield 'delimiterTable', DELIMITER_TABLE_STR
+    yield 'identifierTable', format_identifier_table(unique_identifiers_list)
+    yield 'constantTable', format_constant_table(unique_constants_list)
+
+    pipeline = _get_pipeline()
+
+    # Step 3: Semantic Analysis - Build symbol table
+    analyzer = pipeline.analyzer
+    analyzer.reset()
+    analyzer.analyze(ast)
+    symbol_tables = analyzer.get_symbol_tables_snapshot()
+    
+    yield 'symbolTable', format_synbl(symbol_tables.get("SYNBL", []), analyzer)
+    yield 'typel', format_typel(symbol_tables.get("TYPEL", []))
+    yield 'pfinfl', format_pfinfl(symbol_tables.get("PFINFL", []), analyzer)
+    yield 'ainfl', format_ainfl(symbol_tables.get("AINFL", []), analyzer)
+    yield 'consl', format_consl(symbol_tables.get("CONSL", []), analyzer)
+
+    # Step 4: Generate intermediate code
+    generator = pipeline.generator
+    generator.set_symbol_table(symbol_tables.get("SYNBL", []))
+    code = generator.generate(ast)
+    yield 'intermediate', format_intermediate_code(code)
+
+    # Step 5: Optimize the intermediate code
+    optimizer = pipeline.optimizer
+    optimized_code = optimizer.optimize(code) # Pass the original intermediate code
+    yield 'optimizedIntermediate', format_optimized_code(optimized_code)
+
+
+def _compile_payload(program):
+    """Runs the full pipeline for one program and returns (payload, status_code)."""
+    try:
+        payload = dict(_compile_sections(program))
+    except Exception as e:
+        return {'error': str(e)}, 500
+    return payload, 400 if 'error' in payload else 200
+
+def _compile_response_body(program):
+    """Runs the full pipeline for one program and returns (JSON body bytes, status_code)."""
+    payload, status_code = _compile_payload(program)
+    # orjson serializes the multi-KB result strings considerably faster than jsonify.
+    return orjson.dumps(payload), status_code
+
+# Compilation is deterministic in the program text, so results (including
+# error responses) are memoized already serialized: a repeated submission
+# skips both the pipeline and the JSON encoding.
+_compile_cached = functools.lru_cache(maxsize=256)(_compile_response_body)
+
+
+def _stream_sections(program):
+    """Encodes each compiled section as one NDJSON line: {"phase": ..., "data": ...}."""
+    try:
+        for phase, data in _compile_sections(program):
+            yield orjson.dumps({'phase': phase, 'data': data}) + b"\n"
+    except Exception as e:
+        yield orjson.dumps({'phase': 'error', 'data': str(e)}) + b"\n"
 
 
 @app.route('/compile', methods=['POST'])
@@ -35,144 +191,26 @@ def compile():
 
     if not program:
         return jsonify({'error': 'No program provided. Please enter a valid Pascal program in the textarea.'}), 400
+    if len(program) > MAX_PROGRAM_SIZE:
+        return jsonify({'error': f'Program too large. At most {MAX_PROGRAM_SIZE} characters can be compiled.'}), 413
+    if not _has_program_shape(program):
+        return jsonify({'error': 'Invalid program syntax.' + SYNTAX_ERROR_HINT}), 400
 
     print(f"Received program for compilation:\n{program}")
-    try:
-        # Step 1 & 2: Lexical Analysis and Parsing
-        # The parse function from parser.py returns both collected tokens and the AST.
-        raw_tokens_from_parser, ast = parse(program)
-
-        if ast is None:
-            error_msg = "Invalid program syntax."
-            if not raw_tokens_from_parser and ast is None:
-                error_msg = "Parsing failed: No tokens generated and no AST."
-            elif ast is None:  # Tokens might exist but parsing failed
-                error_msg = "Invalid program syntax. AST could not be constructed."
-            return jsonify({'error': error_msg + ' Please check your Pascal code for correct structure (e.g., program declaration, begin/end blocks).'}), 400
-
-        # --- Prepare maps for the transformed token sequence (similar to main.py) ---
-        # Keyword map: keyword string (lowercase) -> pos
-        sorted_keywords_list = sorted(parser_reserved_keywords.keys())
-        keyword_to_pos = {kw: i + 1 for i,
-                          kw in enumerate(sorted_keywords_list)}
-
-        # Delimiter map: symbol string -> pos
-        _delimiter_type_to_symbol_map = {
-            'SEMICOLON': ';', 'COLON': ':', 'COMMA': ',', 'ASSIGN': ':=', 'DOT': '.',
-            'LPAREN': '(', 'RPAREN': ')', 'PLUS': '+', 'MINUS': '-', 'TIMES': '*',
-            'DIVIDE': '/', 'LT': '<', 'GT': '>', 'EQ': '=', 'LE': '<=', 'GE': '>=',
-            'LSQUARE': '[', 'RSQUARE': ']', 'DOTDOT': '..'
-        }
-        active_delimiter_type_to_symbol = {
-            k: v for k, v in _delimiter_type_to_symbol_map.items() if k in parser_ply_tokens
-        }
-        sorted_delimiter_symbols_list = sorted(
-            list(set(active_delimiter_type_to_symbol.values())))
-        delimiter_symbol_to_pos = {
-            sym: i + 1 for i, sym in enumerate(sorted_delimiter_symbols_list)}
-
-        # Identifier map: identifier string -> pos (from current program's tokens)
-        unique_identifiers_list = sorted(
-            list(set(t.value for t in raw_tokens_from_parser if t.type == 'ID')))
-        identifier_to_pos = {ident: i + 1 for i,
-                             ident in enumerate(unique_identifiers_list)}
-
-        # Constant map: constant string value -> pos (from current program's tokens)
-        unique_constants_list = sorted(list(set(str(
-            t.value) for t in raw_tokens_from_parser if t.type == 'NUMBER' or t.type == 'STRING')))
-        constant_to_pos = {const_val: i + 1 for i,
-                           const_val in enumerate(unique_constants_list)}
-
-        # --- Generate the transformed token sequence string ---
-        transformed_token_sequence_output = []
-        for token_obj in raw_tokens_from_parser:  # Use the collected token objects
-            pos = -1
-            type_code = '?'
-
-            if token_obj.value.lower() in parser_reserved_keywords and \
-               parser_reserved_keywords[token_obj.value.lower()] == token_obj.type and \
-               token_obj.value.lower() in keyword_to_pos:
-                type_code = 'k'
-                pos = keyword_to_pos[token_obj.value.lower()]
-            elif token_obj.type in active_delimiter_type_to_symbol:
-                symbol = active_delimiter_type_to_symbol[token_obj.type]
-                if symbol in delimiter_symbol_to_pos:
-                    type_code = 'd'
-                    pos = delimiter_symbol_to_pos[symbol]
-            elif token_obj.type == 'ID':
-                if token_obj.value in identifier_to_pos:
-                    type_code = 'i'
-                    pos = identifier_to_pos[token_obj.value]
-            elif token_obj.type == 'NUMBER' or token_obj.type == 'STRING':
-                str_val = str(token_obj.value)
-                if str_val in constant_to_pos:
-                    type_code = 'c'
-                    pos = constant_to_pos[str_val]
-
-            if pos != -1:
-                transformed_token_sequence_output.append(
-                    f"({pos},{type_code})")
-            else:
-                # Fallback for unmapped tokens
-                transformed_token_sequence_output.append(
-                    f"(err:{token_obj.type},{token_obj.value})")
-
-        # Format the token sequence string with newlines (e.g., 10 tokens per line)
-        final_token_sequence_str = format_token_sequence(transformed_token_sequence_output)
-
-        # --- Generate Keyword Table String ---
-        final_keyword_table_str = format_keyword_table(parser_reserved_keywords)
-
-        # --- Generate Delimiter Table String ---
-        final_delimiter_table_str = format_delimiter_table(_delimiter_type_to_symbol_map, parser_ply_tokens)
-
-        # --- Generate Identifier Table String ---
-        final_identifier_table_str = format_identifier_table(unique_identifiers_list)
-
-        # --- Generate Constant Table String ---
-        final_constant_table_str = format_constant_table(unique_constants_list)
-
-        # Step 3: Semantic Analysis - Build symbol table
-        analyzer = SemanticAnalyzer()
-        analyzer.analyze(ast)
-        symbol_tables = analyzer.get_symbol_tables_snapshot()
-        
-        synbl_str = format_synbl(symbol_tables.get("SYNBL", []), analyzer)
-        typel_str = format_typel(symbol_tables.get("TYPEL", []))
-        pfinfl_str = format_pfinfl(symbol_tables.get("PFINFL", []), analyzer)
-        ainfl_str = format_ainfl(symbol_tables.get("AINFL", []), analyzer)
-        consl_str = format_consl(symbol_tables.get("CONSL", []), analyzer)
-
-        # Step 4: Generate intermediate code
-        generator = IntermediateCodeGenerator()
-        generator.set_symbol_table(symbol_tables.get("SYNBL", []))
-        code = generator.generate(ast)
-        intermediate_str = format_intermediate_code(code)
-
-        # Step 5: Optimize the intermediate code
-        optimizer = Optimizer()
-        optimized_code = optimizer.optimize(code) # Pass the original intermediate code
-        optimized_intermediate_str = format_optimized_code(optimized_code)
-
-
-        # Format results for display
-        return jsonify({
-            'tokens': final_token_sequence_str,
-            'keywordTable': final_keyword_table_str,
-            'delimiterTable': final_delimiter_table_str,
-            'identifierTable': final_identifier_table_str,
-            'constantTable': final_constant_table_str,
-            'symbolTable': synbl_str,
-            'intermediate': intermediate_str,
-            'optimizedIntermediate': optimized_intermediate_str,
-            'typel': typel_str,
-            'pfinfl': pfinfl_str,
-            'ainfl': ainfl_str,
-            'consl': consl_str
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # Clients that ask for NDJSON get each section as soon as it is computed.
+    # Streamed responses bypass the result cache.
+    if request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+        return Response(_stream_sections(program), mimetype=NDJSON_MIMETYPE)
+
+    # ?nocache=1 recompiles from scratch, e.g. to see the pipeline's console output again.
+    if request.args.get('nocache') == '1':
+        body, status_code = _compile_response_body(program)
+    else:
+        body, status_code = _compile_cached(program)
+    return Response(body, status=status_code, mimetype='application/json')
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only. The reloader is off by default so the parser
+    # tables are loaded once; set FLASK_DEBUG=1 to turn it back on.
+    app.run(host='0.0.0.0', port=5000)
@@ -1,3 +1,4 @@
+import sys
 from semantic import SemanticAnalyzer
 from intermediate import IntermediateCodeGenerator
 from optimizer import Optimizer
@@ -40,11 +41,8 @@ if __name__ == "__main__":
                 break
             ast = parse(s)
             intermediate, target = process(ast)
-            print("Intermediate Code:")
-            for line in intermediate:
-                print(line)
-            print("\nTarget Code:")
-            for line in target:
-                print(line)
+            # One write per compilation instead of one print per line.
+            sys.stdout.write("Intermediate Code:\n" + "".join(f"{line}\n" for line in intermediate)
+                             + "\nTarget Code:\n" + "".join(f"{line}\n" for line in target))
         except EOFError:
             break
@@ -1,20 +1,95 @@
+import operator
+
+
+def _fold_divide(val1, val2):
+    # Integer operands use integer division, as in the optimizer.
+    return val1 // val2 if isinstance(val1, int) and isinstance(val2, int) else val1 / val2
+
+# Binary operators evaluated at compile time when both operands are numeric or
+# boolean constants. The optimizer folds with the same table, so folding early
+# never changes the optimized result.
+CONSTANT_FOLDERS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul, '/': _fold_divide,
+    '<': operator.lt, '>': operator.gt, '=': operator.eq, '<=': operator.le, '>=': operator.ge,
+    'and': lambda val1, val2: val1 and val2,
+    'or': lambda val1, val2: val1 or val2,
+}
+
+def fold_constants(op, val1, val2):
+    """Returns op applied to two constant operands, or None if it can't be folded."""
+    folder = CONSTANT_FOLDERS.get(op)
+    if folder is None:
+        return None
+    try:
+        return folder(val1, val2)
+    except (TypeError, ZeroDivisionError): # Division by zero is left for run time
+        return None
+
+
 class IntermediateCodeGenerator:
+    # Operators whose operands can be swapped; a+b and b+a share one cached temp.
+    commutative_ops = frozenset(['+', '*', '=', '<>', 'and', 'or'])
+    # Operators a while loop may compute once before its first iteration. '/'
+    # is left out because it can trap, e.g. when the body guards it with a
+    # zero test; 'and' and 'not' are left to the condition jump code.
+    hoistable_ops = frozenset(['+', '-', '*', '<', '>', '=', '<=', '>=', '<>'])
+    # Operand key kinds (see generate_expression) whose value is a compile-time constant.
+    constant_kinds = frozenset(['NUMBER', 'REAL_NUMBER', 'BOOLEAN_LITERAL', 'int', 'float', 'bool'])
+    # Expression AST node type -> how generate_expression handles it, so each
+    # node is classified with one dict lookup.
+    expression_node_kinds = {
+        # Literals and identifiers, e.g. ('NUMBER', 123), ('REAL_NUMBER', 3.14),
+        # ('CHAR_LITERAL', 'a'), ('STRING_LITERAL', "hello"), ('BOOLEAN_LITERAL', True), ('ID', 'varname')
+        'NUMBER': 'leaf', 'REAL_NUMBER': 'leaf', 'CHAR_LITERAL': 'leaf',
+        'STRING_LITERAL': 'leaf', 'BOOLEAN_LITERAL': 'leaf', 'ID': 'leaf',
+        'array_access': 'array',
+        # Binary operations like +, -, *, /, <, >, =, <=, >=, <>, and, or
+        '+': 'binary', '-': 'binary', '*': 'binary', '/': 'binary',
+        '<': 'binary', '>': 'binary', '=': 'binary', '<=': 'binary', '>=': 'binary', '<>': 'binary',
+        'and': 'binary', 'or': 'binary',
+        'not': 'unary',
+    }
+
     def __init__(self):
         # Initialize counters and storage for intermediate code generation
         self.temp_count = 0  # Counter for generating unique temporary variable names
         self.label_count = 0  # Counter for generating unique labels for control flow
         self.code = []       # List to store the generated four-tuple instructions
         self.symbol_table = None  # Reference to symbol table for type information
+        # "t0", "t1", ... and "L0", "L1", ...: each name is formatted once and the
+        # same string object is reused across generate() calls.
+        self._temp_names = []
+        self._label_names = []
+        # Common-subexpression cache for the current basic block:
+        # expression key -> temp holding its value, and variable name -> keys reading it.
+        self._expr_cache = {}
+        self._expr_readers = {}
+        # Loop-invariant subexpressions hoisted by the enclosing while loops:
+        # expression key -> temp. Their temps stay reserved below _temp_floor.
+        self._loop_invariants = {}
+        self._temp_floor = 0
+        # Statement type -> bound handler, so dispatch is a single dict lookup.
+        self._stmt_handlers = {
+            'assign': self._generate_assign,
+            'if': self._generate_if,
+            'while': self._generate_while,
+            'writeln': self._generate_writeln,
+        }
 
     def new_temp(self):
         """Generate a new temporary variable name."""
-        temp = f"t{self.temp_count}"
+        if self.temp_count >= len(self._temp_names):
+            # Grow the name table geometrically instead of formatting one name per call.
+            self._temp_names.extend(f"t{i}" for i in range(len(self._temp_names), 2 * self.temp_count + 64))
+        temp = self._temp_names[self.temp_count]
         self.temp_count += 1
         return temp
 
     def new_label(self):
         """Generate a new label for control flow."""
-        label = f"L{self.label_count}"
+        if self.label_count >= len(self._label_names):
+            self._label_names.extend(f"L{i}" for i in range(len(self._label_names), 2 * self.label_count + 64))
+        label = self._label_names[self.label_count]
         self.label_count += 1
         return label
 
@@ -23,6 +98,21 @@ class IntermediateCodeGenerator:
         # The symbol_table is now the entire SYNBL list from the analyzer
         self.symbol_table = {entry['NAME']: entry for entry in symbol_table}
 
+    def _forget_expressions(self):
+        """Drop all cached subexpressions; called wherever a new basic block starts."""
+        self._expr_cache.clear()
+        self._expr_cache.update(self._loop_invariants)
+        self._expr_readers.clear()
+        # Apart from hoisted loop invariants, a temp is only read inside the
+        # block that computes it, so the other temps are dead here and the
+        # next block numbers its temps from the floor again.
+        self.temp_count = self._temp_floor
+
+    def _invalidate_expressions(self, var_name):
+        """Drop the cached subexpressions that read var_name, which is being assigned."""
+        for key in self._expr_readers.pop(var_name, ()):
+            self._expr_cache.pop(key, None)
+
     def generate(self, ast):
         """
         Generate four-tuple intermediate code from the Abstract Syntax Tree (AST).
@@ -31,6 +121,9 @@ class IntermediateCodeGenerator:
         self.code = []
         self.temp_count = 0
         self.label_count = 0
+        self._loop_invariants = {}
+        self._temp_floor = 0
+        self._forget_expressions()
         if isinstance(ast, tuple) and ast[0] == 'program':
             # AST structure: ('program', prog_name, var_declarations, statements)
             _, _, _, stmts = ast
@@ -47,197 +140,410 @@ class IntermediateCodeGenerator:
             # Potentially skip empty statements or handle errors
             return
 
-        stmt_type = stmt[0]
-        if stmt_type == 'assign':
-            # AST: ('assign', target_node, expr_node)
-            # target_node from parser: ('ID', var_name_str) or ('array_access', array_name_str, index_expr_node)
-            target_node, expr_node = stmt[1], stmt[2]
-            
-            expr_result = self.generate_expression(expr_node)
-
-            if target_node[0] == 'ID':
-                var_name = target_node[1]
-                self.code.append(('=', expr_result, '_', var_name))
-            elif target_node[0] == 'array_access':
-                # target_node is ('array_access', array_name_str, index_expr_node)
-                array_name = target_node[1]
-                index_expr = target_node[2]
-                index_result = self.generate_expression(index_expr)
-                # Quad: (op, value_to_store, index_val, array_name)
-                # This signifies: array_name[index_val] = value_to_store
-                self.code.append(('[]=', expr_result, index_result, array_name))
-            else:
-                # Should not happen with current parser structure for assignment
-                raise ValueError(f"Unsupported target for assignment: {target_node}")
-
-        elif stmt_type == 'if':
-            # Assuming (if, cond, _, L_true_target) means "if cond is TRUE, jump to L_true_target"
-            #
-            # Structure for if E then S1 else S2:
-            #   code for E -> cond_result
-            #   L_then = new_label()
-            #   L_else = new_label()
-            #   L_end  = new_label()
-            #   (if, cond_result, _, L_else)  // If false, jump to S1
-            #   code for S1
-            #   (el, _, _, L_end)            // After S1, unconditional jump to L_end
-            #   (lb, _, _, L_else)           // Label for S2
-            #   code for S2
-            #   (ie, _, _, L_end)            // Mark end of if structure
-            #
-            # Structure for if E then S1 (no else):
-            #   code for E -> cond_result
-            #   L_then = new_label()
-            #   L_end  = new_label()
-            #   (if, cond_result, _, L_end)  // If false, jump to S1
-            #   code for S1
-            #   (ie, _, _, L_end)                // Mark end of if structure
-
-            cond, then_stmts, else_stmts = stmt[1], stmt[2], stmt[3]
-            cond_result = self.generate_expression(cond)
-
-            label_then_start = self.new_label()
-            label_if_end = self.new_label()
-            
-            if else_stmts:
-                label_else_start = self.new_label()
-                # If cond_result is FALSE, jump to label_else_start
-                self.code.append(('if', cond_result, '_', label_else_start))
-            
-                self.generate_statements(then_stmts)
-                # After 'then' block, unconditionally jump to the end of the if-else. This is 'el'.
-                self.code.append(('el', '_', '_', label_if_end)) 
+        # One dict lookup on the statement type instead of an if/elif chain.
+        # Unknown statement types are skipped, as before.
+        handler = self._stmt_handlers.get(stmt[0])
+        if handler is not None:
+            handler(stmt)
 
-                # Else block
-                self.code.append(('lb', '_', '_', label_else_start))
-                self.generate_statements(else_stmts)
-                # Fall through to the end label after the else block
-
-                # End of if-else statement
-                self.code.append(('ie', '_', '_', label_if_end)) # Mark if-end
-            else: # No else statement
-                # If cond_result is FALSE, jump to label_then_start
-                self.code.append(('if', cond_result, '_', label_if_end))
-                
+    def _generate_assign(self, stmt):
+        # AST: ('assign', target_node, expr_node)
+        # target_node from parser: ('ID', var_name_str) or ('array_access', array_name_str, index_expr_node)
+        target_node, expr_node = stmt[1], stmt[2]
+        
+        expr_result = self.generate_expression(expr_node)
+
+        if target_node[0] == 'ID':
+            var_name = target_node[1]
+            self.code.append(('=', expr_result, '_', var_name))
+            self._invalidate_expressions(var_name)
+        elif target_node[0] == 'array_access':
+            # target_node is ('array_access', array_name_str, index_expr_node)
+            array_name = target_node[1]
+            index_expr = target_node[2]
+            index_result = self.generate_expression(index_expr)
+            # Quad: (op, value_to_store, index_val, array_name)
+            # This signifies: array_name[index_val] = value_to_store
+            self.code.append(('[]=', expr_result, index_result, array_name))
+            self._invalidate_expressions(array_name)
+        else:
+            # Should not happen with current parser structure for assignment
+            raise ValueError(f"Unsupported target for assignment: {target_node}")
+
+    def _generate_if(self, stmt):
+        # Assuming (if, cond, _, L_true_target) means "if cond is TRUE, jump to L_true_target"
+        #
+        # Structure for if E then S1 else S2:
+        #   code for E -> cond_result
+        #   L_end  = new_label()
+        #   L_else = new_label()
+        #   (if, cond_result, _, L_else)  // If false, jump to S1
+        #   code for S1
+        #   (el, _, _, L_end)            // After S1, unconditional jump to L_end
+        #   (lb, _, _, L_else)           // Label for S2
+        #   code for S2
+        #   (ie, _, _, L_end)            // Mark end of if structure
+        #
+        # Structure for if E then S1 (no else):
+        #   code for E -> cond_result
+        #   L_end  = new_label()
+        #   (if, cond_result, _, L_end)  // If false, jump to S1
+        #   code for S1
+        #   (ie, _, _, L_end)                // Mark end of if structure
+
+        cond, then_stmts, else_stmts = stmt[1], stmt[2], stmt[3]
+
+        cond_jumps = self._generate_condition_jumps(cond, 'if')
+
+        # A condition folded to a constant selects its branch at compile time;
+        # the other branch and the jumps around it are not generated, and no
+        # labels are allocated for them.
+        if isinstance(cond_jumps, bool):
+            if cond_jumps:
                 self.generate_statements(then_stmts)
-                # Fall through to the end label after the then block
-
-                # End of if statement
-                self.code.append(('ie', '_', '_', label_if_end)) # Mark if-end
-
-        elif stmt_type == 'while':
-            # Following the rule: while (E) S
-            # L_eval_E: (label for start of condition evaluation)
-            # ... code for E ... -> cond_res
-            # (do, cond_res, _, L_exit) ; if cond_res is false, jump to L_exit
-            # ... code for S ...
-            # (we, _, _, L_eval_E)     ; jump back to L_eval_E
-            # L_exit: (label for loop exit)
-            
-            cond_expr, body_stmts = stmt[1], stmt[2]
-
-            label_eval_E = self.new_label()    # Label for the start of condition evaluation (target for 'we')
-            label_loop_exit = self.new_label() # Label for loop exit (target for 'do')
-
-            self.code.append(('wh', '_', '_', '_'))  # Emit the 'while' instruction
-
-            # Create the label for the start of condition evaluation.
-            self.code.append(('lb', '_', '_', label_eval_E))
-            
-            # Generate quadruples for condition E, result in res(E).
-            cond_result = self.generate_expression(cond_expr)
-
-            # Emit: (do, cond_result, _, label_loop_exit)
-            # This instruction means: if cond_result is false, jump to label_loop_exit.
-            self.code.append(('do', cond_result, '_', label_loop_exit))
-
-            # Generate quadruples for statement S (the loop body).
-            self.generate_statements(body_stmts)
-
-            # Emit: (we, _, _, label_eval_E)
-            # This instruction means: unconditional jump to label_eval_E.
-            self.code.append(('we', '_', '_', label_eval_E))
-            # self.code.append(('gt', '_', '_', label_eval_E))
-
-            # Create the label for the loop exit.
-            self.code.append(('lb', '_', '_', label_loop_exit))
-
-        elif stmt_type == 'writeln':
-            # Assuming 'writeln' translates to one or more 'write' operations
-            # The markdown doesn't specify 'writeln' or 'write' opcodes.
-            # We'll use a 'write' opcode for each argument.
-            expr_list = stmt[1] # This is a list of expressions from parser
-            if isinstance(expr_list, list):
-                for expr_item in expr_list:
-                    item_result = self.generate_expression(expr_item)
-                    self.code.append(('write', item_result, '_', '_'))
-            else: # Single expression for writeln (should be list based on parser)
-                item_result = self.generate_expression(expr_list)
-                self.code.append(('write', item_result, '_', '_'))
+            elif else_stmts:
+                self.generate_statements(else_stmts)
+            return
+
+        label_if_end = self.new_label()
+        label_else_start = self.new_label() if else_stmts else None
+
+        # If cond is FALSE, jump to the else block (or past the then block).
+        self._patch_jumps(cond_jumps, label_else_start or label_if_end)
+        
+        if else_stmts:
+            self.generate_statements(then_stmts)
+            # After 'then' block, unconditionally jump to the end of the if-else. This is 'el'.
+            self.code.append(('el', '_', '_', label_if_end)) 
+
+            # Else block
+            self.code.append(('lb', '_', '_', label_else_start))
+            self._forget_expressions()
+            self.generate_statements(else_stmts)
+            # Fall through to the end label after the else block
+
+            # End of if-else statement
+            self.code.append(('ie', '_', '_', label_if_end)) # Mark if-end
+            self._forget_expressions()
+        else: # No else statement
+            self.generate_statements(then_stmts)
+            # Fall through to the end label after the then block
+
+            # End of if statement
+            self.code.append(('ie', '_', '_', label_if_end)) # Mark if-end
+            self._forget_expressions()
+
+    def _generate_while(self, stmt):
+        # Following the rule: while (E) S
+        # (wh) ; loop marker
+        # ... loop-invariant subexpressions of E and S, computed once; their
+        #     temps are kept out of reuse until the loop ends ...
+        # L_eval_E: (label for start of condition evaluation)
+        # ... code for E ... -> cond_res
+        # (do, cond_res, _, L_exit) ; if cond_res is false, jump to L_exit
+        # ... code for S ...
+        # (we, _, _, L_eval_E)     ; jump back to L_eval_E
+        # L_exit: (label for loop exit)
+        
+        cond_expr, body_stmts = stmt[1], stmt[2]
+
+        loop_start = len(self.code)
+        self.code.append(('wh', '_', '_', '_'))  # Emit the 'while' instruction
+        # Nothing computed before the loop can be reused inside it, but the
+        # enclosing loops' invariants can.
+        self._forget_expressions()
+
+        # Hoist the loop invariants. They get a block of their own, so the
+        # optimizer cannot merge their temps into variables assigned earlier.
+        outer_invariants, outer_temp_floor = self._loop_invariants, self._temp_floor
+        for invariant_expr in self._loop_invariant_subtrees(cond_expr, body_stmts):
+            self.generate_expression(invariant_expr)
+        self._loop_invariants = dict(self._expr_cache)
+        self._temp_floor = self.temp_count
+
+        # Create the label for the start of condition evaluation. It is
+        # allocated, and filled in, once the condition is known not to be false.
+        eval_label_index = len(self.code)
+        self.code.append(('lb', '_', '_', None))
+        # The condition is re-evaluated on every iteration.
+        self._forget_expressions()
+        
+        # Generate quadruples for condition E, each followed by
+        # (do, cond_result, _, label_loop_exit): if cond_result is false, jump to label_loop_exit.
+        cond_jumps = self._generate_condition_jumps(cond_expr, 'do')
+        if cond_jumps is False:
+            # The condition folded to false, so the body never runs: drop the
+            # loop header emitted above (a folded condition emits no quads).
+            del self.code[loop_start:]
+            self._loop_invariants, self._temp_floor = outer_invariants, outer_temp_floor
+            self._forget_expressions()
+            return
+
+        label_eval_E = self.new_label()    # Label for the start of condition evaluation (target for 'we')
+        label_loop_exit = self.new_label() # Label for loop exit (target for 'do')
+        self._patch_jumps([eval_label_index], label_eval_E)
+        if cond_jumps is not True: # An always-true condition emits no jumps
+            self._patch_jumps(cond_jumps, label_loop_exit)
+
+        # Generate quadruples for statement S (the loop body).
+        self.generate_statements(body_stmts)
+
+        # Emit: (we, _, _, label_eval_E)
+        # This instruction means: unconditional jump to label_eval_E.
+        self.code.append(('we', '_', '_', label_eval_E))
+
+        # Create the label for the loop exit.
+        self.code.append(('lb', '_', '_', label_loop_exit))
+        # This loop's invariants are dead after the loop.
+        self._loop_invariants, self._temp_floor = outer_invariants, outer_temp_floor
+        self._forget_expressions()
+
+    def _loop_invariant_subtrees(self, cond_expr, body_stmts):
+        """
+        Return the largest subexpressions of a while loop's condition and body
+        (nested statements included) built from hoistable operators over
+        constants and variables the body never assigns, left to right.
+        """
+        exprs = [cond_expr]
+        assigned = set()
+        pending = list(reversed(body_stmts))
+        while pending:
+            stmt = pending.pop()
+            if not isinstance(stmt, tuple) or not stmt:
+                continue
+            stmt_type = stmt[0]
+            if stmt_type == 'assign':
+                target_node, expr_node = stmt[1], stmt[2]
+                assigned.add(target_node[1]) # Variable or array name
+                exprs.append(expr_node)
+                if target_node[0] == 'array_access':
+                    exprs.append(target_node[2])
+            elif stmt_type == 'if':
+                exprs.append(stmt[1])
+                pending.extend(reversed(stmt[3] or []))
+                pending.extend(reversed(stmt[2]))
+            elif stmt_type == 'while':
+                exprs.append(stmt[1])
+                pending.extend(reversed(stmt[2]))
+            elif stmt_type == 'writeln':
+                exprs.extend(stmt[1] if isinstance(stmt[1], list) else [stmt[1]])
+
+        # Visit every node once, then decide invariance children-first.
+        visited = []
+        work = list(exprs)
+        while work:
+            node = work.pop()
+            visited.append(node)
+            if isinstance(node, tuple) and self.expression_node_kinds.get(node[0]) in ('binary', 'unary', 'array'):
+                work.extend(node[1:] if node[0] != 'array_access' else node[2:])
+        invariant = {}
+        for node in reversed(visited):
+            if isinstance(node, (int, float, bool)):
+                invariant[id(node)] = True
+            elif isinstance(node, str):
+                invariant[id(node)] = node not in assigned
+            elif not isinstance(node, tuple) or not node:
+                invariant[id(node)] = False
+            elif self.expression_node_kinds.get(node[0]) == 'leaf':
+                invariant[id(node)] = node[0] != 'ID' or node[1] not in assigned
+            else:
+                invariant[id(node)] = (node[0] in self.hoistable_ops and len(node) == 3
+                                       and invariant[id(node[1])] and invariant[id(node[2])])
+
+        subtrees = []
+        work = list(reversed(exprs))
+        while work:
+            node = work.pop()
+            if not isinstance(node, tuple) or not node:
+                continue
+            if node[0] in self.hoistable_ops and invariant.get(id(node)):
+                subtrees.append(node)
+            elif self.expression_node_kinds.get(node[0]) in ('binary', 'unary', 'array'):
+                work.extend(reversed(node[1:] if node[0] != 'array_access' else node[2:]))
+        return subtrees
+
+    def _generate_condition_jumps(self, cond, jump_op):
+        """
+        Emit the conditional jumps (jump_op: 'if' or 'do') taken when cond is
+        false. The operands of an 'and' chain are tested one at a time, left to
+        right, so the ones after a false operand are never evaluated, and no
+        temp holds the combined result.
+        Returns the condition's value if it folded to True or False before any
+        jump was emitted. Otherwise the jumps are emitted without a target and
+        their indexes in self.code are returned for _patch_jumps, so the
+        caller only allocates labels for conditions that need them.
+        """
+        pending = [cond]
+        jump_indexes = []
+        while pending:
+            node = pending.pop()
+            if isinstance(node, tuple) and node[0] == 'and' and len(node) == 3:
+                pending.append(node[2])
+                pending.append(node[1])
+                continue
+
+            cond_result = self.generate_expression(node)
+            if cond_result is True:
+                continue # Never jumps
+            if cond_result is False and not jump_indexes:
+                return False
+            jump_indexes.append(len(self.code))
+            self.code.append((jump_op, cond_result, '_', None))
+            self._forget_expressions()
+            if cond_result is False:
+                break # Always jumps; the remaining operands are unreachable
+        return jump_indexes or True
 
+    def _patch_jumps(self, jump_indexes, label):
+        """Fill in label as the target of the quads at jump_indexes."""
+        for index in jump_indexes:
+            op, arg1, arg2, _ = self.code[index]
+            self.code[index] = (op, arg1, arg2, label)
+
+    def _generate_writeln(self, stmt):
+        # Assuming 'writeln' translates to one or more 'write' operations
+        # The markdown doesn't specify 'writeln' or 'write' opcodes.
+        # We'll use a 'write' opcode for each argument.
+        expr_list = stmt[1] # This is a list of expressions from parser
+        if isinstance(expr_list, list):
+            for expr_item in expr_list:
+                item_result = self.generate_expression(expr_item)
+                self.code.append(('write', item_result, '_', '_'))
+        else: # Single expression for writeln (should be list based on parser)
+            item_result = self.generate_expression(expr_list)
+            self.code.append(('write', item_result, '_', '_'))
 
     def generate_expression(self, expr):
-        if isinstance(expr, (int, float, bool)): # Direct constants
-            return expr
-        elif isinstance(expr, str):
-            # This might be a direct string literal if not wrapped by parser, 
-            # or a temp var name, or an ID name.
-            # The semantic analyzer should ensure IDs are valid.
-            # If it's a known temp or var, it's fine. If it's a string literal for 'write', it's also fine.
-            return expr
-        elif isinstance(expr, tuple):
-            node_type = expr[0]
-
-            # Handle specific AST node types for literals and identifiers
-            if node_type == 'NUMBER':           # e.g., ('NUMBER', 123)
-                return expr[1]
-            elif node_type == 'REAL_NUMBER':    # e.g., ('REAL_NUMBER', 3.14)
-                return expr[1] 
-            elif node_type == 'CHAR_LITERAL':   # e.g., ('CHAR_LITERAL', 'a')
-                return expr[1]
-            elif node_type == 'STRING_LITERAL': # e.g., ('STRING_LITERAL', "hello")
-                return expr[1]
-            elif node_type == 'BOOLEAN_LITERAL':# e.g., ('BOOLEAN_LITERAL', True)
-                return expr[1]
-            elif node_type == 'ID':           # e.g., ('ID', 'varname')
-                return expr[1] # The identifier name itself is the "value" here for quad generation
-            
-            # Handle array access: A[i]
-            elif node_type == 'array_access': # AST: ('array_access', array_name_str, index_expr_node)
-                array_name = expr[1]
-                index_expr_node = expr[2]
-                
-                index_result = self.generate_expression(index_expr_node) # Get the value of the index
-                
-                temp_array_val = self.new_temp()
-                # Quad: (op, array_name, index_val, result_temp)
-                # This signifies: result_temp = array_name[index_val]
-                self.code.append(('=[]', array_name, index_result, temp_array_val))
-                return temp_array_val
-
-            # For binary operations like +, -, *, /, <, >, =, <=, >=, and, or
-            elif node_type in ('+', '-', '*', '/', '<', '>', '=', '<=', '>=', '<>', 'and', 'or'): # Added <> for inequality
-                if len(expr) == 3: # Binary operation
-                    left_val = self.generate_expression(expr[1])
-                    right_val = self.generate_expression(expr[2])
+        """
+        Generate code for an expression and return the operand holding its value.
+        The tree is walked post-order with an explicit stack rather than by
+        recursion, so deeply nested expressions don't hit the recursion limit.
+        Left operands are generated before right ones and an operator takes its
+        temp after its operands, so temps are numbered as a recursive walk would.
+
+        Operators are keyed by (op, operand keys) and an operation already
+        computed in the current basic block reuses its temp instead of emitting
+        a new quad. A leaf's key is its kind and value, a computed operand's key
+        is its temp; temps are assigned once per basic block, so the temp stands
+        in for the whole subtree.
+        """
+        results = []              # Operand values of the sub-expressions finished so far
+        keys = []                 # Matching CSE keys: ('ID', name), ('NUMBER', 1), ('temp', 't0'), ...
+        work = [(expr, False)]    # (node, operands_done) pairs still to visit
+        while work:
+            node, operands_done = work.pop()
+
+            if operands_done:
+                # All operands of this node are on the results stack; emit it.
+                node_type = node[0]
+                if node_type == 'array_access':
+                    # Array reads are not cached: stores through another index
+                    # expression may alias the same element.
+                    # Quad: (op, array_name, index_val, result_temp)
+                    # This signifies: result_temp = array_name[index_val]
+                    keys.pop()
+                    index_result = results.pop()
                     temp_result = self.new_temp()
-                    self.code.append((node_type, left_val, right_val, temp_result))
-                    return temp_result
-            # Handle unary 'not'
-            elif node_type == 'not': 
-                if len(expr) == 2: # Unary operation
-                    operand_val = self.generate_expression(expr[1])
+                    self.code.append(('=[]', node[1], index_result, temp_result))
+                    results.append(temp_result)
+                    keys.append(('temp', temp_result))
+                    continue
+
+                if node_type == 'not':
+                    operand_keys = (keys.pop(),)
+                    operands = (results.pop(), '_')
+                else:
+                    right_key, left_key = keys.pop(), keys.pop()
+                    right_val = results.pop()
+                    left_val = results.pop()
+                    if left_key[0] in self.constant_kinds and right_key[0] in self.constant_kinds:
+                        # Both operands are constants: use the value instead of emitting a quad.
+                        folded_value = fold_constants(node_type, left_val, right_val)
+                        if folded_value is not None:
+                            results.append(folded_value)
+                            keys.append((type(folded_value).__name__, folded_value))
+                            continue
+                    operands = (left_val, right_val)
+                    if node_type in self.commutative_ops and right_key < left_key:
+                        operand_keys = (right_key, left_key)
+                    else:
+                        operand_keys = (left_key, right_key)
+
+                expr_key = (node_type,) + operand_keys
+                temp_result = self._expr_cache.get(expr_key)
+                if temp_result is None:
                     temp_result = self.new_temp()
-                    self.code.append((node_type, operand_val, '_', temp_result)) 
-                    return temp_result
-            # Potentially handle unary minus if your AST supports it
-            # elif node_type == 'uminus' and len(expr) == 2:
-            #     operand_val = self.generate_expression(expr[1])
-            #     temp_result = self.new_temp()
-            #     self.code.append(('-', 0, operand_val, temp_result)) # Or a specific 'uminus' op
-            #     return temp_result
-            
-        raise ValueError(f"Unsupported expression type or structure: {expr}")
+                    self.code.append((node_type, operands[0], operands[1], temp_result))
+                    self._expr_cache[expr_key] = temp_result
+                    for operand_kind, operand_value in operand_keys:
+                        if operand_kind == 'ID':
+                            self._expr_readers.setdefault(operand_value, []).append(expr_key)
+                results.append(temp_result)
+                keys.append(('temp', temp_result))
+                continue
+
+            if isinstance(node, (int, float, bool)): # Direct constants
+                results.append(node)
+                keys.append((type(node).__name__, node))
+                continue
+            elif isinstance(node, str):
+                # This might be a direct string literal if not wrapped by parser, 
+                # or a temp var name, or an ID name.
+                # The semantic analyzer should ensure IDs are valid.
+                # If it's a known temp or var, it's fine. If it's a string literal for 'write', it's also fine.
+                results.append(node)
+                keys.append(('ID', node)) # Treated as a variable, so assignments to it invalidate
+                continue
+            elif isinstance(node, tuple):
+                node_type = node[0]
+                node_kind = self.expression_node_kinds.get(node_type)
+
+                # Handle specific AST node types for literals and identifiers
+                if node_kind == 'leaf':
+                    results.append(node[1]) # The identifier name itself is the "value" here for quad generation
+                    keys.append((node_type, node[1]))
+                    continue
+
+                # Handle array access: A[i]
+                elif node_kind == 'array': # AST: ('array_access', array_name_str, index_expr_node)
+                    work.append((node, True))
+                    work.append((node[2], False)) # The index expression
+                    continue
+
+                # For binary operations like +, -, *, /, <, >, =, <=, >=, and, or
+                elif node_kind == 'binary':
+                    if len(node) == 3: # Binary operation
+                        left, right = node[1], node[2]
+                        if (type(left) is tuple and type(right) is tuple
+                                and self.expression_node_kinds.get(left[0]) == 'leaf'
+                                and self.expression_node_kinds.get(right[0]) == 'leaf'):
+                            # Most operations combine two identifiers or literals:
+                            # push both operands at once instead of visiting them.
+                            # A (kind, value) leaf node is its own CSE key.
+                            results.append(left[1])
+                            keys.append(left)
+                            results.append(right[1])
+                            keys.append(right)
+                            work.append((node, True))
+                            continue
+                        # Pushed right first so the left operand is generated first.
+                        work.append((node, True))
+                        work.append((node[2], False))
+                        work.append((node[1], False))
+                        continue
+                # Handle unary 'not'
+                elif node_kind == 'unary':
+                    if len(node) == 2: # Unary operation
+                        work.append((node, True))
+                        work.append((node[1], False))
+                        continue
+                # Potentially handle unary minus if your AST supports it
+                # elif node_type == 'uminus' and len(node) == 2:
+                #     ... emit ('-', 0, operand_val, temp_result) # Or a specific 'uminus' op
+
+            raise ValueError(f"Unsupported expression type or structure: {node}")
+
+        return results.pop()
 
     def get_code(self):
         """Return the generated intermediate code."""
@@ -1,5 +1,7 @@
 import collections
 
+from intermediate import fold_constants
+
 class DagNode:
     def __init__(self, node_id, op, value=None, children=None, captured_child_markers=None): # Added captured_child_markers
         self.id = node_id
@@ -14,7 +16,7 @@ class DagNode:
     def __repr__(self):
         child_ids = [c.id for c in self.children]
         # Optionally include captured_child_markers in repr for debugging
-        return f"Node(id={self.id}, op='{self.op}', val={self.value}, main='{self.main_marker}', markers={sorted(list(str(m) for m in self.markers))}, children={child_ids}, captured_operands={self.captured_child_markers})"
+        return f"Node(id={self.id}, op='{self.op}', val={self.value}, main='{self.main_marker}', markers={sorted(str(m) for m in self.markers)}, children={child_ids}, captured_operands={self.captured_child_markers})"
 
 
     def _is_temporary(self, var_name):
@@ -33,13 +35,26 @@ class DagNode:
             self.additional_markers = []
             return
 
-        sorted_markers = sorted(list(self.markers), key=lambda m: (self._get_marker_priority(m), str(m)))
+        sorted_markers = sorted(self.markers, key=lambda m: (self._get_marker_priority(m), str(m)))
         
         self.main_marker = sorted_markers[0]
         self.additional_markers = [m for m in sorted_markers[1:] if m != self.main_marker]
 
 
 class Optimizer:
+    # Operator categories. These never change, so they are shared by all instances
+    # and stored as frozensets for constant-time membership tests.
+    arithmetic_ops = frozenset(['+', '-', '*', '/'])
+    relational_ops = frozenset(['<', '>', '=', '<=', '>='])
+    logical_ops = frozenset(['and', 'or'])
+    computational_ops = arithmetic_ops | relational_ops | logical_ops
+    # Add 'wh', 'el', 'ie' to control_flow_ops
+    control_flow_ops = frozenset(['lb', 'gt', 'if', 'do', 'we', 'wh', 'el', 'ie'])
+    io_ops = frozenset(['write'])
+    control_io_ops = control_flow_ops | io_ops
+    commutative_ops = frozenset(['+', '*', '=', 'and', 'or'])
+    array_ops = frozenset(['[]=', '=[]']) # Add new category for array operations
+
     def __init__(self):
         self.node_id_counter = 0
         self.dag_nodes = {}
@@ -47,19 +62,6 @@ class Optimizer:
         self.expr_to_node_id = {}
         self.ordered_nodes_for_codegen = []
 
-        # Operator categories (can be class level or initialized here)
-        self.arithmetic_ops = ['+', '-', '*', '/']
-        self.relational_ops = ['<', '>', '=', '<=', '>=']
-        self.logical_ops = ['and', 'or']
-        self.computational_ops = self.arithmetic_ops + self.relational_ops + self.logical_ops
-        # Add 'wh', 'el', 'ie' to control_flow_ops
-        self.control_flow_ops = ['lb', 'gt', 'if', 'do', 'we', 'wh', 'el', 'ie'] 
-        self.io_ops = ['write']
-        self.control_io_ops = self.control_flow_ops + self.io_ops
-        self.commutative_ops = ['+', '*', '=', 'and', 'or']
-        self.array_ops = ['[]=', '=[]'] # Add new category for array operations
-
-
     def _new_node_id(self):
         self.node_id_counter += 1
         return self.node_id_counter
@@ -103,31 +105,23 @@ class Optimizer:
         if not code_tuples:
             return []
 
+        # Fast path: straight-line code (no labels, jumps or loop markers) is a
+        # single basic block, so the leader scan can be skipped entirely.
+        if self.control_flow_ops.isdisjoint([op for op, _, _, _ in code_tuples]):
+            return [code_tuples]
+
         leaders = {0}
         branch_causing_ops = {'gt', 'if', 'do', 'we', 'el'} # 'el' is also an unconditional jump
 
-        for i, (op, _, _, res) in enumerate(code_tuples):
-            if op == 'wh' or op == 'lb': 
+        # Jump targets are always 'lb' or 'ie' markers, and every one of them
+        # starts a block, so a branch only has to mark the instruction that follows it.
+        for i, (op, _, _, _) in enumerate(code_tuples):
+            if op == 'wh' or op == 'lb' or op == 'ie': # 'ie' is where an if's branches join
                 leaders.add(i)
+            elif op in branch_causing_ops and i + 1 < len(code_tuples): # Instruction following a branch
+                leaders.add(i + 1)
 
-            if op in branch_causing_ops:
-                if op in ['if', 'do', 'gt', 'we', 'el'] and res != '_' and isinstance(res, str): # Targets of jumps
-                    for j, (inner_op, _, _, inner_res_label) in enumerate(code_tuples):
-                        if inner_op == 'lb' and inner_res_label == res:
-                            leaders.add(j)
-                            break
-                if i + 1 < len(code_tuples): # Instruction following a branch
-                    leaders.add(i + 1)
-            # 'ie' does not inherently define a leader, it's a marker.
-
-        unique_sorted_leaders = sorted(list(leaders))
-        # Further ensure uniqueness if multiple conditions make the same index a leader
-        if not unique_sorted_leaders: return []
-        
-        final_leaders = [unique_sorted_leaders[0]]
-        for k in range(1, len(unique_sorted_leaders)):
-            if unique_sorted_leaders[k] > final_leaders[-1]:
-                 final_leaders.append(unique_sorted_leaders[k])
+        final_leaders = sorted(leaders)
         
         blocks = []
         for i in range(len(final_leaders)):
@@ -160,22 +154,9 @@ class Optimizer:
                 folded_value = None
                 if node_arg1 and node_arg1.op == 'CONST' and \
                    (not node_arg2 or (node_arg2 and node_arg2.op == 'CONST')):
-                    val1, val2 = node_arg1.value, node_arg2.value if node_arg2 else None
-                    try:
-                        if op == '+': folded_value = val1 + val2
-                        elif op == '-': folded_value = val1 - val2
-                        elif op == '*': folded_value = val1 * val2
-                        elif op == '/' and val2 != 0:
-                            folded_value = val1 // val2 if isinstance(val1, int) and isinstance(val2, int) else val1 / val2
-                        elif op == '<': folded_value = val1 < val2
-                        elif op == '>': folded_value = val1 > val2
-                        elif op == '=': folded_value = val1 == val2 # Comparison
-                        elif op == '<=': folded_value = val1 <= val2
-                        elif op == '>=': folded_value = val1 >= val2
-                        elif op == 'and': folded_value = val1 and val2
-                        elif op == 'or': folded_value = val1 or val2
-                    except (TypeError, ZeroDivisionError): folded_value = None
-                
+                    # One dispatch-table lookup, shared with the intermediate code generator
+                    folded_value = fold_constants(op, node_arg1.value, node_arg2.value if node_arg2 else None)
+
                 if folded_value is not None:
                     current_op_node = self._get_or_create_leaf_node(folded_value)
                 else: 
@@ -420,41 +401,6 @@ class Optimizer:
 
         return all_optimized_code
 
-    def optimize_block(self, block):
-        optimized_block = []
-
-        i = 0
-        while i < len(block):
-            instr = block[i]
-            op, arg1, arg2, res = instr
-
-            # --- Add handling for array operations ---
-            if op == '[]=': # Array store: array_name[index_val] = value_to_store
-                # For now, no specific optimization, just include it
-                optimized_block.append(instr)
-                i += 1
-                continue
-            elif op == '=[]': # Array fetch: result_temp = array_name[index_val]
-                # For now, no specific optimization, just include it
-                optimized_block.append(instr)
-                i += 1
-                continue
-            # --- End of new handling ---
-
-            # ... (your existing optimization rules for other ops like '+', '=', 'if', etc.) ...
-            
-            # Example of a default case if other ops are not handled:
-            # else:
-            #     print(f"Warning (opt_block): Unhandled op '{op}'") # This is where your warning comes from
-            #     optimized_block.append(instr)
-            #     i += 1
-            
-            # If you have a more structured way (e.g., a dictionary of handlers), add them there.
-            # If your default is just to append unhandled ops, the warnings would stop if
-            # the 'else' block that prints the warning is removed or made more specific.
-
-        return optimized_block
-
 
 if __name__ == "__main__":
     optimizer = Optimizer()
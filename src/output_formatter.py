@@ -1,123 +1,133 @@
+from itertools import chain
+
+
+def _synbl_columns(entry, analyzer_instance):
+    """Returns the (name, type, category, addr/info) cells for one SYNBL entry."""
+    name_str = str(entry.get('NAME', 'N/A'))
+    cat_str = str(entry.get('CAT', 'N/A'))
+
+    type_ptr = entry.get('TYPE_PTR')
+    type_name_str = "N/A"
+
+    if type_ptr is not None and analyzer_instance:
+        try:
+            is_array_var = False
+            # Check if it's a variable and if its type is an array
+            if cat_str == 'v': # It's a variable
+                if 0 <= type_ptr < len(analyzer_instance.typel):
+                    typel_entry = analyzer_instance.typel[type_ptr]
+                    if typel_entry.get('KIND') == 'array':
+                        is_array_var = True
+
+            if is_array_var:
+                # For array variables, show the TYPEL pointer
+                type_name_str = f"TYPEL_PTR:{type_ptr}"
+            else:
+                # For non-array variables and other categories, get the descriptive type name
+                type_name_str = analyzer_instance.get_type_name_from_ptr(type_ptr)
+        except Exception: # pylint: disable=broad-except
+            # Fallback if any error occurs during type resolution
+            type_name_str = f"TYPEL_PTR:{type_ptr} (Err)"
+    elif type_ptr is not None: # If analyzer_instance is None but type_ptr exists
+        type_name_str = f"TYPEL_PTR:{type_ptr}"
+    # If type_ptr is None, type_name_str remains "N/A"
+
+    addr_ptr = entry.get('ADDR_PTR')
+    addr_info_str = "N/A" # Default
+    if cat_str == 'f' and isinstance(addr_ptr, int): # Function/Procedure
+        addr_info_str = f"PFINFL_IDX:{addr_ptr}"
+    elif cat_str == 'c' and isinstance(addr_ptr, int): # Constant
+        addr_info_str = f"CONSL_IDX:{addr_ptr}"
+    elif cat_str in ['v', 'p_val', 'p_ref'] and addr_ptr is not None: # Variable or parameter
+        addr_info_str = str(addr_ptr)
+    elif cat_str == 't' and type_ptr is not None: # Type definition itself
+        addr_info_str = f"TYPEL_PTR:{type_ptr}"
+    elif cat_str == 'program_name':
+        addr_info_str = "-" # Or some other relevant info if available
+
+    return name_str, type_name_str, cat_str, addr_info_str
+
+def _header_lines(header):
+    """Returns the (header, separator) lines that start a table."""
+    return header, "-" * len(header)
+
+def _format_table(headings, rows):
+    """Joins the header and rows, each column padded to its widest cell."""
+    rows = list(rows)
+    widths = [max(len(heading), max((len(row[col]) for row in rows), default=0))
+              for col, heading in enumerate(headings)]
+    # The last column is left unpadded so no line carries trailing spaces.
+    lead_widths = widths[:-1]
+    def line(cells):
+        return " | ".join([cell.ljust(width) for cell, width in zip(cells, lead_widths)] + [cells[-1]])
+    header = line(headings)
+    # The separator spans the widest row, not just the header.
+    separator = "-" * (sum(widths) + 3 * len(lead_widths))
+    return "\n".join(chain((header, separator), map(line, rows)))
+
+_SYNBL_HEADINGS = ('Idx', 'Name', 'Type', 'Cat', 'Addr/Info')
+_TYPEL_HEADINGS = ('Idx', 'Kind', 'Details')
+_PFINFL_HEADINGS = ('Idx', 'Level', 'Params', 'Return Type', 'Entry Label', 'Param SYNBL Idxs')
+_AINFL_HEADINGS = ('Idx', 'Element Type', 'LowerB', 'UpperB', 'Size')
+_CONSL_HEADINGS = ('Idx', 'Value', 'Type')
+
 def format_synbl(synbl, analyzer_instance):
-    lines = []
     if not synbl:
-        lines.append("SYNBL is empty.")
-        return "\n".join(lines)
-    # Header: Idx | Name | Type | Cat | Addr/Info
-    header = f"{'Idx':<3} | {'Name':<15} | {'Type':<20} | {'Cat':<7} | {'Addr/Info':<20}" # Adjusted Type width
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, entry in enumerate(synbl):
-        name_str = str(entry.get('NAME', 'N/A'))
-        cat_str = str(entry.get('CAT', 'N/A'))
-        
-        type_ptr = entry.get('TYPE_PTR')
-        type_name_str = "N/A" 
-
-        if type_ptr is not None and analyzer_instance:
-            try:
-                is_array_var = False
-                # Check if it's a variable and if its type is an array
-                if cat_str == 'v': # It's a variable
-                    if 0 <= type_ptr < len(analyzer_instance.typel):
-                        typel_entry = analyzer_instance.typel[type_ptr]
-                        if typel_entry.get('KIND') == 'array':
-                            is_array_var = True
-                
-                if is_array_var:
-                    # For array variables, show the TYPEL pointer
-                    type_name_str = f"TYPEL_PTR:{type_ptr}"
-                else:
-                    # For non-array variables and other categories, get the descriptive type name
-                    type_name_str = analyzer_instance.get_type_name_from_ptr(type_ptr)
-            except Exception: # pylint: disable=broad-except
-                # Fallback if any error occurs during type resolution
-                type_name_str = f"TYPEL_PTR:{type_ptr} (Err)"
-        elif type_ptr is not None: # If analyzer_instance is None but type_ptr exists
-            type_name_str = f"TYPEL_PTR:{type_ptr}"
-        # If type_ptr is None, type_name_str remains "N/A"
-
-        addr_ptr = entry.get('ADDR_PTR')
-        addr_info_str = "N/A" # Default
-        if cat_str == 'f' and isinstance(addr_ptr, int): # Function/Procedure
-            addr_info_str = f"PFINFL_IDX:{addr_ptr}"
-        elif cat_str == 'c' and isinstance(addr_ptr, int): # Constant
-            addr_info_str = f"CONSL_IDX:{addr_ptr}"
-        elif cat_str in ['v', 'p_val', 'p_ref'] and addr_ptr is not None: # Variable or parameter
-            addr_info_str = str(addr_ptr)
-        elif cat_str == 't' and type_ptr is not None: # Type definition itself
-            addr_info_str = f"TYPEL_PTR:{type_ptr}"
-        elif cat_str == 'program_name':
-            addr_info_str = "-" # Or some other relevant info if available
-
-        lines.append(f"{i:<3} | {name_str:<15} | {type_name_str:<20} | {cat_str:<7} | {addr_info_str:<20}")
-    return "\n".join(lines)
+        return "SYNBL is empty."
+    rows = ((str(i),) + _synbl_columns(entry, analyzer_instance) for i, entry in enumerate(synbl))
+    return _format_table(_SYNBL_HEADINGS, rows)
+
+def _typel_details(entry):
+    if entry.get('KIND') == 'basic':
+        return f"Name: {entry.get('NAME')}"
+    if entry.get('KIND') == 'array':
+        return f"AINFL_PTR: {entry.get('AINFL_PTR')}"
+    return ""
 
 def format_typel(typel):
-    lines = []
     if not typel:
-        lines.append("TYPEL is empty.")
-        return "\n".join(lines)
-    header = f"{'Idx':<3} | {'Kind':<10} | {'Details':<30}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, entry in enumerate(typel):
-        details_str = ""
-        if entry.get('KIND') == 'basic':
-            details_str = f"Name: {entry.get('NAME')}"
-        elif entry.get('KIND') == 'array':
-            details_str = f"AINFL_PTR: {entry.get('AINFL_PTR')}"
-        lines.append(f"{i:<3} | {str(entry.get('KIND')):<10} | {details_str:<30}")
-    return "\n".join(lines)
+        return "TYPEL is empty."
+    rows = ((str(i), str(entry.get('KIND')), _typel_details(entry)) for i, entry in enumerate(typel))
+    return _format_table(_TYPEL_HEADINGS, rows)
+
+def _pfinfl_return_type(entry, analyzer_instance):
+    if entry.get('RETURN_TYPE_PTR', -1) != -1:
+        return analyzer_instance.get_type_name_from_ptr(entry.get('RETURN_TYPE_PTR'))
+    return "PROCEDURE"
 
 def format_pfinfl(pfinfl, analyzer_instance):
-    lines = []
     if not pfinfl:
-        lines.append("PFINFL is empty.")
-        return "\n".join(lines)
-    header = f"{'Idx':<3} | {'Level':<5} | {'Params':<6} | {'Return Type':<15} | {'Entry Label':<20} | {'Param SYNBL Idxs':<20}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, entry in enumerate(pfinfl):
-        ret_type_name = "PROCEDURE"
-        if entry.get('RETURN_TYPE_PTR', -1) != -1:
-             ret_type_name = analyzer_instance.get_type_name_from_ptr(entry.get('RETURN_TYPE_PTR'))
-        param_idxs_str = ", ".join(map(str, entry.get('PARAM_SYNBL_INDICES', [])))
-        lines.append(f"{i:<3} | {str(entry.get('LEVEL')):<5} | {str(entry.get('PARAM_COUNT')):<6} | {ret_type_name:<15} | {str(entry.get('ENTRY_LABEL')):<20} | {param_idxs_str:<20}")
-    return "\n".join(lines)
+        return "PFINFL is empty."
+    rows = (
+        (str(i), str(entry.get('LEVEL')), str(entry.get('PARAM_COUNT')), _pfinfl_return_type(entry, analyzer_instance),
+         str(entry.get('ENTRY_LABEL')), ", ".join(map(str, entry.get('PARAM_SYNBL_INDICES', []))))
+        for i, entry in enumerate(pfinfl)
+    )
+    return _format_table(_PFINFL_HEADINGS, rows)
 
 def format_ainfl(ainfl, analyzer_instance):
-    lines = []
     if not ainfl:
-        lines.append("AINFL is empty.")
-        return "\n".join(lines)
-    header = f"{'Idx':<3} | {'Element Type':<20} | {'LowerB':<6} | {'UpperB':<6} | {'Size':<5}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, entry in enumerate(ainfl):
-        el_type_name = analyzer_instance.get_type_name_from_ptr(entry.get('ELEMENT_TYPE_PTR', -1))
-        lines.append(f"{i:<3} | {el_type_name:<20} | {str(entry.get('LOWER_BOUND')):<6} | {str(entry.get('UPPER_BOUND')):<6} | {str(entry.get('TOTAL_SIZE')):<5}")
-    return "\n".join(lines)
+        return "AINFL is empty."
+    rows = (
+        (str(i), analyzer_instance.get_type_name_from_ptr(entry.get('ELEMENT_TYPE_PTR', -1)), str(entry.get('LOWER_BOUND')),
+         str(entry.get('UPPER_BOUND')), str(entry.get('TOTAL_SIZE')))
+        for i, entry in enumerate(ainfl)
+    )
+    return _format_table(_AINFL_HEADINGS, rows)
 
 def format_consl(consl, analyzer_instance):
-    lines = []
     if not consl:
-        lines.append("CONSL is empty.")
-        return "\n".join(lines)
-    header = f"{'Idx':<3} | {'Value':<20} | {'Type':<20}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, entry in enumerate(consl):
-        type_name = analyzer_instance.get_type_name_from_ptr(entry.get('TYPE_PTR', -1))
-        lines.append(f"{i:<3} | {str(entry.get('VALUE')):<20} | {type_name:<20}")
-    return "\n".join(lines)
+        return "CONSL is empty."
+    rows = (
+        (str(i), str(entry.get('VALUE')), analyzer_instance.get_type_name_from_ptr(entry.get('TYPE_PTR', -1)))
+        for i, entry in enumerate(consl)
+    )
+    return _format_table(_CONSL_HEADINGS, rows)
 
 
 def format_keyword_table(keywords_map):
-    lines = []
     if not keywords_map:
-        lines.append("No keywords defined.")
-        return "\n".join(lines)
+        return "No keywords defined."
     
     sorted_keywords = sorted(keywords_map.keys())
     max_idx_len = len(str(len(sorted_keywords)))
@@ -125,21 +135,18 @@ def format_keyword_table(keywords_map):
     max_token_len = max(len(keywords_map[kw]) for kw in sorted_keywords) if sorted_keywords else 10
     
     header = f"{'Pos':<{max_idx_len}} | {'Keyword':<{max_keyword_len}} | {'Token Type':<{max_token_len}}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, keyword in enumerate(sorted_keywords):
-        pos = i + 1
-        lines.append(f"{str(pos):<{max_idx_len}} | {keyword:<{max_keyword_len}} | {keywords_map[keyword]:<{max_token_len}}")
-    return "\n".join(lines)
+    rows = (
+        " | ".join((str(pos).ljust(max_idx_len), keyword.ljust(max_keyword_len), keywords_map[keyword].ljust(max_token_len)))
+        for pos, keyword in enumerate(sorted_keywords, 1)
+    )
+    return "\n".join(chain(_header_lines(header), rows))
 
 def format_delimiter_table(delimiter_map, available_tokens):
-    lines = []
     active_delimiters = {k: v for k, v in delimiter_map.items() if k in available_tokens}
-    sorted_symbols = sorted(list(set(active_delimiters.values())))
+    sorted_symbols = sorted(set(active_delimiters.values()))
     
     if not sorted_symbols:
-        lines.append("No delimiters defined.")
-        return "\n".join(lines)
+        return "No delimiters defined."
 
     symbol_to_types = {sym: [] for sym in sorted_symbols}
     for token_type, sym in active_delimiters.items():
@@ -150,87 +157,54 @@ def format_delimiter_table(delimiter_map, available_tokens):
     max_type_len = max(len(", ".join(types)) for types in symbol_to_types.values())
 
     header = f"{'Pos':<{max_idx_len}} | {'Symbol':<{max_symbol_len}} | {'Token Type(s)':<{max_type_len}}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, symbol in enumerate(sorted_symbols):
-        pos = i + 1
-        type_names = ", ".join(symbol_to_types[symbol])
-        lines.append(f"{str(pos):<{max_idx_len}} | {symbol:<{max_symbol_len}} | {type_names:<{max_type_len}}")
-    return "\n".join(lines)
+    rows = (
+        " | ".join((str(pos).ljust(max_idx_len), symbol.ljust(max_symbol_len), ", ".join(symbol_to_types[symbol]).ljust(max_type_len)))
+        for pos, symbol in enumerate(sorted_symbols, 1)
+    )
+    return "\n".join(chain(_header_lines(header), rows))
 
 def format_identifier_table(identifiers):
-    lines = []
     if not identifiers:
-        lines.append("No identifiers found.")
-        return "\n".join(lines)
+        return "No identifiers found."
     
     max_idx_len = len(str(len(identifiers)))
     max_id_len = max(len(identifier) for identifier in identifiers) if identifiers else 10
     
     header = f"{'Pos':<{max_idx_len}} | {'Identifier':<{max_id_len}}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, identifier in enumerate(identifiers):
-        pos = i + 1
-        lines.append(f"{str(pos):<{max_idx_len}} | {identifier:<{max_id_len}}")
-    return "\n".join(lines)
+    rows = (str(pos).ljust(max_idx_len) + " | " + identifier.ljust(max_id_len) for pos, identifier in enumerate(identifiers, 1))
+    return "\n".join(chain(_header_lines(header), rows))
 
 def format_constant_table(constants):
-    lines = []
     if not constants:
-        lines.append("No constants found.")
-        return "\n".join(lines)
+        return "No constants found."
         
     max_idx_len = len(str(len(constants)))
     max_const_len = max(len(constant) for constant in constants) if constants else 10
 
     header = f"{'Pos':<{max_idx_len}} | {'Constant':<{max_const_len}}"
-    lines.append(header)
-    lines.append("-" * len(header))
-    for i, constant in enumerate(constants):
-        pos = i + 1
-        lines.append(f"{str(pos):<{max_idx_len}} | {constant:<{max_const_len}}")
-    return "\n".join(lines)
+    rows = (str(pos).ljust(max_idx_len) + " | " + constant.ljust(max_const_len) for pos, constant in enumerate(constants, 1))
+    return "\n".join(chain(_header_lines(header), rows))
 
 
 def format_token_sequence(sequence):
-    lines = []
     if not sequence:
-        lines.append("No token sequence generated.")
-        return "\n".join(lines)
-    
-    for i in range(0, len(sequence), 10):
-        lines.append(" ".join(sequence[i:i+10]))
-    return "\n".join(lines)
+        return "No token sequence generated."
+    # Ten entries per line, joined straight into the result.
+    return "\n".join([" ".join(sequence[i:i+10]) for i in range(0, len(sequence), 10)])
+
+
+def _format_quads(code):
+    # One f-string per quad, joined once; the tuple is unpacked directly in the loop.
+    return "\n".join([f"({op}, {arg1}, {arg2}, {res})" for op, arg1, arg2, res in code])
 
 
 def format_intermediate_code(code):
-    lines = []
     if not code:
-        lines.append("No intermediate code generated.")
-        return "\n".join(lines)
-    
-    for i, quad in enumerate(code):
-        op, arg1, arg2, res = quad
-        op_str = str(op)
-        arg1_str = str(arg1)
-        arg2_str = str(arg2)
-        res_str = str(res)
-        lines.append(f"({op_str}, {arg1_str}, {arg2_str}, {res_str})")
-    return "\n".join(lines)
+        return "No intermediate code generated."
+    return _format_quads(code)
 
 
 def format_optimized_code(optimized_code):
-    lines = []
     if not optimized_code:
-        lines.append("No optimized code generated.")
-        return "\n".join(lines)
-    
-    for i, quad in enumerate(optimized_code):
-        op, arg1, arg2, res = quad
-        op_str = str(op)
-        arg1_str = str(arg1)
-        arg2_str = str(arg2)
-        res_str = str(res)
-        lines.append(f"({op_str}, {arg1_str}, {arg2_str}, {res_str})")
-    return "\n".join(lines)
+        return "No optimized code generated."
+    return _format_quads(optimized_code)
@@ -1,3 +1,9 @@
+import copy
+import os
+import pickle
+import sys
+import threading
+
 import ply.lex as lex
 import ply.yacc as yacc
 
@@ -99,10 +105,15 @@ reserved = {
 def t_ID(t):
     r'[a-zA-Z][a-zA-Z0-9]*'
     t.type = reserved.get(t.value.lower(), 'ID')  # Check if it's a reserved keyword
+    # Identifier names are used as dict keys by every later stage; interning makes
+    # repeated occurrences share one string, so lookups can match by identity.
+    t.value = sys.intern(t.value)
     # print(f"Token: ID, Value: {t.value}, Line: {t.lineno}, Position: {t.lexpos}")
     return t
 
-t_ignore = ' \t'
+# '\r' is skipped so CRLF sources (files read without newline translation,
+# programs pasted into the API) lex the same as LF ones.
+t_ignore = ' \t\r'
 
 def t_newline(t):
     r'\n+'
@@ -333,7 +344,40 @@ def p_error(p):
     else:
         print("Syntax error in input at EOF!")
 
-parser = yacc.yacc(debug=False) # You can control debug logging here or via a parameter
+# The LALR tables are cached as a pickle next to this module. PLY checks the
+# grammar signature on load and regenerates the file when the grammar changes,
+# so worker processes only pay for table construction on a cold cache.
+PARSETAB_PICKLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsetab.pickle')
+
+def _discard_truncated_parsetab(path):
+    """Delete the cached tables at path if they can't be unpickled, e.g. after an interrupted write."""
+    # PLY only treats a missing or outdated file as a cache miss; any other
+    # unpickling error would be raised on every import.
+    try:
+        with open(path, 'rb') as in_f:
+            for _ in range(6): # Version, method, signature, action, goto, productions
+                pickle.load(in_f)
+    except FileNotFoundError:
+        return
+    except (EOFError, pickle.UnpicklingError):
+        try:
+            os.remove(path)
+        except FileNotFoundError: # Another worker removed it first
+            pass
+
+_discard_truncated_parsetab(PARSETAB_PICKLE)
+parser = yacc.yacc(debug=False, picklefile=PARSETAB_PICKLE) # You can control debug logging here or via a parameter
+
+# PLY keeps per-run state on both the lexer and the parser object, so each thread
+# parses with its own lexer clone and a shallow parser copy. The LALR tables
+# themselves are read-only and stay shared.
+_thread_state = threading.local()
+
+def _thread_lexer_and_parser():
+    if not hasattr(_thread_state, 'parser'):
+        _thread_state.lexer = lexer.clone()
+        _thread_state.parser = copy.copy(parser)
+    return _thread_state.lexer, _thread_state.parser
 
 def parse(input_string, debug_parser=False):
     """
@@ -350,19 +394,17 @@ def parse(input_string, debug_parser=False):
     if not input_string:
         return [], None # Return empty tokens and no AST for empty input
 
+    thread_lexer, thread_parser = _thread_lexer_and_parser()
+
     # 1. Lexical Analysis: Collect all tokens
-    lexer.input(input_string)
-    collected_tokens = []
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
-        collected_tokens.append(tok)
+    thread_lexer.input(input_string)
+    thread_lexer.lineno = 1 # lexer.input() keeps the line count from the previous run
+    collected_tokens = list(iter(thread_lexer.token, None))
 
     # 2. Syntactic Analysis: Parse the tokens to build AST
-    # Reset lexer for the parser. PLY's yacc.parse() will use this lexer instance.
-    lexer.input(input_string) 
-    ast = parser.parse(input_string, lexer=lexer, debug=debug_parser)
+    # The parser consumes the tokens collected above instead of re-lexing the input.
+    token_stream = iter(collected_tokens)
+    ast = thread_parser.parse(lexer=thread_lexer, tokenfunc=lambda: next(token_stream, None), debug=debug_parser)
     # print(f"AST: {ast}") #if debug_parser else None  # Print AST if debugging is enabled
     return collected_tokens, ast
 
@@ -4,21 +4,30 @@ METADATA_SLOTS_BEFORE_PARAMS = 1 # Additional slots before parameters (e.g., for
 PARAMS_BASE_OFFSET = LINKAGE_SIZE + METADATA_SLOTS_BEFORE_PARAMS # Parameters start at this offset (e.g., 4)
 
 class SemanticAnalyzer:
+    # Define sizes for basic types (shared by all instances, never modified)
+    type_sizes = {
+        "INTEGER": 4,
+        "REAL": 8,
+        "BOOLEAN": 1,
+        "CHAR": 1
+        # Add other basic types if any
+    }
+    # Operator categories for expression type checking, as frozensets for
+    # constant-time membership tests.
+    arithmetic_ops = frozenset(['+', '-', '*', '/'])
+    binary_ops = arithmetic_ops | frozenset(['<', '>', '=', '<=', '>=', '<>', 'and', 'or'])
+
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears all per-program state so the analyzer can be reused for another AST."""
         self.synbl = []
         self.typel = []
         self.pfinfl = []
         self.ainfl = []
         self.consl = []
-
-        # Define sizes for basic types
-        self.type_sizes = {
-            "INTEGER": 4,
-            "REAL": 8,
-            "BOOLEAN": 1,
-            "CHAR": 1
-            # Add other basic types if any
-        }
+        self._type_names = {}  # Memoized get_type_name_from_ptr results for this program
 
         self.current_level = 0
         self.scope_id_counter = 0
@@ -51,19 +60,6 @@ class SemanticAnalyzer:
         self.typel.append(typel_entry)
         return len(self.typel) - 1
     
-    def _resolve_type_name_to_ptr(self, type_name_str):
-        """Resolves a type name (string) to a TYPEL pointer. Handles basic and declared types."""
-        type_name_upper = type_name_str.upper()
-        # Check basic types first
-        for i, t_entry in enumerate(self.typel):
-            if t_entry.get('KIND') == 'basic' and t_entry.get('NAME') == type_name_upper:
-                return i
-        # Check user-defined types
-        type_symbol = self.lookup_symbol(type_name_str, category_filter='t')
-        if type_symbol:
-            return type_symbol['TYPE_PTR']
-        raise ValueError(f"Type '{type_name_str}' not found.")
-
     def enter_scope(self, scope_type="block"): # Add scope_type if needed for different offset rules
         self.current_level += 1
         self.scope_id_counter += 1
@@ -98,92 +94,6 @@ class SemanticAnalyzer:
         self.scope_stack[-1] = (level, scope_id, current_offset + type_size)
         return current_offset
 
-    def _add_array_type_to_typel(self, element_type_ptr, lower_bound, upper_bound):
-        if not (0 <= element_type_ptr < len(self.typel)):
-            raise ValueError(f"Invalid element_type_ptr {element_type_ptr} for array.")
-        
-        element_type_info = self.typel[element_type_ptr]
-        element_size = element_type_info.get('SIZE')
-        if element_size is None:
-            raise ValueError(f"Element type {self.get_type_name_from_ptr(element_type_ptr)} for array has no defined size.")
-
-        num_elements = upper_bound - lower_bound + 1
-        if num_elements <= 0:
-            raise ValueError(f"Array must have a positive number of elements. Bounds: {lower_bound}..{upper_bound}")
-        
-        array_total_size = num_elements * element_size
-
-        # Optional: Check if an identical array type (same element type, bounds, and thus size) already exists in AINFL/TYPEL
-        for i, typel_entry in enumerate(self.typel):
-            if typel_entry.get('KIND') == 'array' and typel_entry.get('SIZE') == array_total_size:
-                ainfl_ptr_candidate = typel_entry.get('AINFL_PTR')
-                if 0 <= ainfl_ptr_candidate < len(self.ainfl):
-                    existing_ainfl = self.ainfl[ainfl_ptr_candidate]
-                    if (existing_ainfl.get('ELEMENT_TYPE_PTR') == element_type_ptr and
-                        existing_ainfl.get('LOWER_BOUND') == lower_bound and
-                        existing_ainfl.get('UPPER_BOUND') == upper_bound and
-                        existing_ainfl.get('NUM_ELEMENTS') == num_elements and 
-                        existing_ainfl.get('ELEMENT_SIZE') == element_size and
-                        existing_ainfl.get('TOTAL_SIZE') == array_total_size): # Also check total size in AINFL
-                        return i # Return existing TYPEL index
-
-        ainfl_entry = {
-            'ELEMENT_TYPE_PTR': element_type_ptr,
-            'LOWER_BOUND': lower_bound,
-            'UPPER_BOUND': upper_bound,
-            'NUM_ELEMENTS': num_elements,
-            'ELEMENT_SIZE': element_size,
-            'TOTAL_SIZE': array_total_size # Store total size directly in AINFL
-        }
-        self.ainfl.append(ainfl_entry)
-        ainfl_ptr = len(self.ainfl) - 1
-
-        typel_entry = {'KIND': 'array', 'AINFL_PTR': ainfl_ptr, 'SIZE': array_total_size}
-        self.typel.append(typel_entry)
-        return len(self.typel) - 1
-
-    def _resolve_type_ast_node_to_ptr(self, type_ast_node):
-        """
-        Resolves a type AST node (from parser) to a TYPEL pointer.
-        Handles basic type names (strings) and array_type tuples.
-        """
-        if isinstance(type_ast_node, str): # e.g. 'INTEGER'
-            return self._resolve_type_name_to_ptr(type_ast_node) # Existing method for name resolution
-        elif isinstance(type_ast_node, tuple) and type_ast_node[0] == 'array_type':
-            # type_ast_node is ('array_type', low_bound_node, high_bound_node, base_type_ast_node_for_element)
-            low_bound_node = type_ast_node[1]
-            high_bound_node = type_ast_node[2]
-            base_type_ast_node_for_element = type_ast_node[3]
-
-            if not (isinstance(low_bound_node, tuple) and low_bound_node[0] == 'NUMBER' and
-                    isinstance(high_bound_node, tuple) and high_bound_node[0] == 'NUMBER'):
-                raise ValueError(f"Array bounds must be number literals. Got {low_bound_node}, {high_bound_node}")
-            
-            lower_bound = low_bound_node[1] # e.g., 1 from ('NUMBER', 1)
-            upper_bound = high_bound_node[1] # e.g., 5 from ('NUMBER', 5)
-
-            if not isinstance(lower_bound, int) or not isinstance(upper_bound, int):
-                raise ValueError(f"Array bounds must be integers. Got {lower_bound}, {upper_bound}")
-            if lower_bound > upper_bound:
-                raise ValueError(f"Array lower bound {lower_bound} cannot be greater than upper bound {upper_bound}.")
-
-            # Recursively resolve the element's type AST node to get its type_ptr
-            element_type_ptr = self._resolve_type_ast_node_to_ptr(base_type_ast_node_for_element)
-            
-            # num_elements = upper_bound - lower_bound + 1 # Calculated in _add_array_type_to_typel
-
-            # Optional: Check if an identical array type already exists in TYPEL to avoid duplicates
-            # This check is now more robustly handled within _add_array_type_to_typel
-            return self._add_array_type_to_typel(element_type_ptr, lower_bound, upper_bound)
-        else:
-            raise ValueError(f"Unsupported type AST node structure for resolution: {type_ast_node}")
-
-    def _add_constant_to_consl(self, value, type_ptr):
-        """Adds a constant to CONSL and returns its index."""
-        # Could add check for existing identical constant to reuse
-        self.consl.append({'VALUE': value, 'TYPE_PTR': type_ptr})
-        return len(self.consl) - 1
-
     def _get_type_size(self, type_ptr):
         """
         Returns the size of a type in memory units (e.g., words).
@@ -211,83 +121,6 @@ class SemanticAnalyzer:
         # Add other kinds (records, etc.)
         return 1 # Default for other complex types
 
-
-    def declare_symbol(self, name, category, type_name_or_struct, details=None):
-        current_level, current_scope_id, current_next_offset = self.scope_stack[-1]
-
-        for entry in self.synbl:
-            if entry['NAME'] == name and entry['LEVEL'] == current_level and entry['SCOPE_ID'] == current_scope_id:
-                raise ValueError(f"Symbol '{name}' already declared in scope (L{current_level}, S{current_scope_id})")
-
-        type_ptr = -1
-        var_size = 0 # Size of this specific variable/constant/type
-
-        if category in ['v', 'c', 'p_val', 'p_ref'] or \
-           (category == 'f' and type_name_or_struct is not None):
-            if isinstance(type_name_or_struct, str):
-                type_ptr = self._resolve_type_name_to_ptr(type_name_or_struct)
-            elif isinstance(type_name_or_struct, int): 
-                if 0 <= type_name_or_struct < len(self.typel):
-                    type_ptr = type_name_or_struct
-                else:
-                    raise ValueError(f"Invalid type_ptr {type_name_or_struct} passed for '{name}'.")
-            else:
-                raise ValueError(f"Unsupported type information for '{name}' (category '{category}'): {type_name_or_struct}. Expected type name string or type_ptr int.")
-            
-            if 0 <= type_ptr < len(self.typel):
-                var_size = self.typel[type_ptr].get('SIZE', 0) # Get size from TYPEL
-            elif category == 'c' and details and 'value' in details: # For constants, size might depend on literal type if not explicitly typed
-                if isinstance(details['value'], int): var_size = self.type_sizes['INTEGER']
-                elif isinstance(details['value'], float): var_size = self.type_sizes['REAL']
-                elif isinstance(details['value'], bool): var_size = self.type_sizes['BOOLEAN']
-                elif isinstance(details['value'], str) and len(details['value']) == 1 : var_size = self.type_sizes['CHAR']
-                # String literals would need more complex size handling if stored directly
-        
-        elif category == 't': # Actual Type definition (e.g. type MyArr = array...)
-            type_ptr = self._resolve_type_ast_node_to_ptr(type_name_or_struct)
-            if 0 <= type_ptr < len(self.typel): # The "size" of a type definition itself is its defined size
-                var_size = self.typel[type_ptr].get('SIZE', 0)
-        elif category == 'program_name' or (category == 'f' and type_name_or_struct is None): # Procedure
-            type_ptr = -1 
-            var_size = 0 # No direct data size for program name or procedure symbol itself
-        else:
-            raise ValueError(f"Unhandled category '{category}' or type_name_or_struct '{type_name_or_struct}' combination for type resolution in declare_symbol for '{name}'.")
-
-        # ADDR_PTR calculation (offset within the current scope/activation record)
-        addr_ptr_value = None # Default for symbols that don't have a direct memory offset (like type names, program name)
-        
-        if category in ['v', 'p_val', 'p_ref']: # Variables and parameters get a (level, offset)
-            # current_next_offset is the starting offset for this symbol in the current scope
-            # current_level is the static nesting level
-            addr_ptr_value = (current_level, current_next_offset) 
-            
-            new_next_offset_for_scope = current_next_offset + var_size # Calculate the next available offset
-            
-            # Update the current scope's next available offset on the stack
-            self.scope_stack[-1] = (current_level, current_scope_id, new_next_offset_for_scope)
-        elif category == 'c': # Constants might point to CONSL or have a value directly
-            if details and 'CONSL_PTR' in details:
-                addr_ptr_value = details['CONSL_PTR'] # Or some other representation
-            # else, addr_ptr_value remains None if constant value is embedded or not stored with an "address"
-        # For 't' (type definitions), 'program_name', 'f' (functions/procedures themselves),
-        # ADDR_PTR might be None or point to TYPEL/PFINFL.
-        # For now, addr_ptr_value remains None if not 'v', 'p_val', or 'p_ref' unless specified (e.g. for constants).
-
-
-        synbl_entry = {
-            'NAME': name,
-            'CAT': category,
-            'TYPE_PTR': type_ptr,
-            'LEVEL': current_level,
-            'SCOPE_ID': current_scope_id,
-            'ADDR_PTR': addr_ptr_value, # Storing (level, offset) for vars/params, or other info
-            'SIZE': var_size, 
-            'INITIALIZED': False 
-        }
-        self.synbl.append(synbl_entry)
-        # print(f"Declared: {new_symbol}") # This was 'new_symbol', should be 'synbl_entry' if uncommented
-        return synbl_entry
-
     def _add_array_type_to_typel(self, element_type_ptr, lower_bound, upper_bound):
         if not (0 <= element_type_ptr < len(self.typel)):
             raise ValueError(f"Invalid element_type_ptr {element_type_ptr} for array.")
@@ -528,13 +361,22 @@ class SemanticAnalyzer:
         raise ValueError(f"Type mismatch in {operation_desc}: Type1 ({self.get_type_name_from_ptr(type_ptr1)}) vs Type2 ({self.get_type_name_from_ptr(type_ptr2)})")
 
     def get_type_name_from_ptr(self, type_ptr):
+        type_name = self._type_names.get(type_ptr)
+        if type_name is not None: return type_name
+        # Out-of-range pointers are not cached: TYPEL may still grow to cover them.
         if type_ptr < 0 or type_ptr >= len(self.typel): return "invalid_type_ptr"
         t_info = self.typel[type_ptr]
-        if t_info['KIND'] == 'basic': return t_info['NAME']
-        if t_info['KIND'] == 'array':
+        if t_info['KIND'] == 'basic':
+            type_name = t_info['NAME']
+        elif t_info['KIND'] == 'array':
             el_ptr = self.ainfl[t_info['AINFL_PTR']]['ELEMENT_TYPE_PTR']
-            return f"ARRAY OF {self.get_type_name_from_ptr(el_ptr)}"
-        return "unknown_complex_type"
+            type_name = f"ARRAY OF {self.get_type_name_from_ptr(el_ptr)}"
+        else:
+            type_name = "unknown_complex_type"
+        # TYPEL/AINFL entries are never modified once appended, so the name is
+        # stable until reset().
+        self._type_names[type_ptr] = type_name
+        return type_name
 
     def analyze(self, ast):
         if not ast: return
@@ -828,7 +670,7 @@ class SemanticAnalyzer:
             self.check_type_compatibility(int_type_ptr, index_expr_type_ptr, f"array index for '{array_name_str}' in expression")
             
             return element_type_ptr
-        elif node_type in ['+', '-', '*', '/', '<', '>', '=', '<=', '>=', '<>', 'and', 'or']: # Binary operators
+        elif node_type in self.binary_ops: # Binary operators
             # ... (your existing logic for binary operators) ...
             left_expr = expr_node[1]
             right_expr = expr_node[2]
@@ -838,7 +680,7 @@ class SemanticAnalyzer:
             # Example for arithmetic:
             int_type_ptr = self._ensure_basic_type('INTEGER')
             real_type_ptr = self._ensure_basic_type('REAL')
-            if node_type in ['+', '-', '*', '/']:
+            if node_type in self.arithmetic_ops:
                 if not ((left_type_ptr == int_type_ptr or left_type_ptr == real_type_ptr) and \
                         (right_type_ptr == int_type_ptr or right_type_ptr == real_type_ptr)):
                     raise ValueError(f"Arithmetic operation '{node_type}' requires numeric operands.")
@@ -1,6 +1,21 @@
 import re
 
 class TargetCodeGenerator:
+    # Assembly reserved words that identifiers must not collide with (checked
+    # case-insensitively). This list should be comprehensive for your target
+    # assembler (e.g., NASM, MASM)
+    reserved_keywords = frozenset([
+        "MOV", "ADD", "SUB", "MUL", "DIV", "CMP", "JMP", "JE", "JNE", "JG", "JL", "JGE", "JLE", 
+        "AX", "BX", "CX", "DX", "SI", "DI", "SP", "BP", "CS", "DS", "ES", "SS",
+        "PROC", "ENDP", "DW", "DB", "BYTE", "WORD", "DWORD", "QWORD", "OFFSET",
+        "LEA", "CALL", "RET", "INT", "PUSH", "POP", "LOOP", "NEG", "NOT", "AND", "OR", "XOR", "SHL", "SHR",
+        "MODEL", "STACK", "DATA", "CODE", "INCLUDE", "END", "IF", "ELSE", "ENDIF", "WHILE", "ENDW", 
+        "PRINT_STRING_CUSTOM", "PRINT_NUMBER_CUSTOM", "PRINT_NEWLINE_CUSTOM" # Add own proc names
+    ])
+    # Operator categories, as frozensets for constant-time membership tests
+    arithmetic_ops = frozenset(['+', '-', '*', '/'])
+    relational_ops = frozenset(['>', '<', '>=', '<=', '==', '!='])
+
     def __init__(self, synbl=None, typel=None, ainfl=None): # MODIFIED
         self.assembly_code = []
         self.data_segment_lines = []
@@ -14,6 +29,12 @@ class TargetCodeGenerator:
         self.synbl = synbl if synbl is not None else []
         self.typel = typel if typel is not None else []
         self.ainfl = ainfl if ainfl is not None else []
+        # Variable entries by name, so declaring a name is one dict lookup
+        # instead of a scan of synbl (the first entry wins, as the scan did).
+        self.variable_entries = {}
+        for entry in self.synbl:
+            if entry.get('CAT') == 'v':
+                self.variable_entries.setdefault(entry.get('NAME'), entry)
 
     def _new_uid_label(self, prefix="LBL"):
         self.label_uid_counter += 1
@@ -32,16 +53,7 @@ class TargetCodeGenerator:
             sanitized = '_' + sanitized
         
         # Avoid collision with assembly reserved keywords by appending "_var"
-        # This list should be comprehensive for your target assembler (e.g., NASM, MASM)
-        reserved_keywords = [
-            "MOV", "ADD", "SUB", "MUL", "DIV", "CMP", "JMP", "JE", "JNE", "JG", "JL", "JGE", "JLE", 
-            "AX", "BX", "CX", "DX", "SI", "DI", "SP", "BP", "CS", "DS", "ES", "SS",
-            "PROC", "ENDP", "DW", "DB", "BYTE", "WORD", "DWORD", "QWORD", "OFFSET",
-            "LEA", "CALL", "RET", "INT", "PUSH", "POP", "LOOP", "NEG", "NOT", "AND", "OR", "XOR", "SHL", "SHR",
-            "MODEL", "STACK", "DATA", "CODE", "INCLUDE", "END", "IF", "ELSE", "ENDIF", "WHILE", "ENDW", 
-            "PRINT_STRING_CUSTOM", "PRINT_NUMBER_CUSTOM", "PRINT_NEWLINE_CUSTOM" # Add own proc names
-        ]
-        if sanitized.upper() in reserved_keywords:
+        if sanitized.upper() in self.reserved_keywords:
             sanitized += "_var"
         return sanitized
 
@@ -56,12 +68,7 @@ class TargetCodeGenerator:
             return sanitized_name # Already declared
 
         # Try to find the variable in the symbol table (synbl)
-        symbol_entry = None
-        # Search in synbl for the original variable name
-        for entry in self.synbl: # Iterate through the provided synbl
-            if entry.get('NAME') == var_name_original and entry.get('CAT') == 'v':
-                symbol_entry = entry
-                break
+        symbol_entry = self.variable_entries.get(var_name_original)
         
         declaration_line = None
 
@@ -193,7 +200,7 @@ class TargetCodeGenerator:
                 if arg1_asm and res_asm:
                     self._load_to_reg("AX", arg1_asm)
                     self.code_segment_lines.append(f"    MOV {res_asm}, AX")
-            elif op in ['+', '-', '*', '/']: # Arithmetic
+            elif op in self.arithmetic_ops: # Arithmetic
                 if arg1_asm: self._load_to_reg("AX", arg1_asm)
                 arg2_for_op = arg2_asm
                 if op in ['*', '/'] and arg2_asm and not arg2_asm.startswith('['):
@@ -214,7 +221,7 @@ class TargetCodeGenerator:
                         self.code_segment_lines.append(f"    DIV BX")
                 if res_asm: self.code_segment_lines.append(f"    MOV {res_asm}, AX")
 
-            elif op in ['>', '<', '>=', '<=', '==', '!=']: # Relational ops
+            elif op in self.relational_ops: # Relational ops
                 # Note: IR uses '=' for comparison, which is fine if distinct from assignment '='
                 if arg1_asm: self._load_to_reg("AX", arg1_asm)
                 if arg2_asm:
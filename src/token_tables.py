@@ -0,0 +1,87 @@
+from parser import tokens as parser_tokens, reserved as parser_reserved
+from output_formatter import format_keyword_table, format_delimiter_table
+
+# Shared by the API and the command line driver: the keyword (k), delimiter (d),
+# identifier (i) and constant (c) tables, and the "(pos,type_code)" token sequence.
+
+# --- Static token tables ---
+# These only depend on the grammar, so they are built once at import time.
+
+# Keyword map: keyword string (lowercase) -> pos
+SORTED_KEYWORDS = sorted(parser_reserved.keys())
+KEYWORD_TO_POS = {kw: i + 1 for i, kw in enumerate(SORTED_KEYWORDS)}
+
+# Delimiter map: symbol string -> pos
+DELIMITER_TYPE_TO_SYMBOL = {
+    'SEMICOLON': ';', 'COLON': ':', 'COMMA': ',', 'ASSIGN': ':=', 'DOT': '.',
+    'LPAREN': '(', 'RPAREN': ')', 'PLUS': '+', 'MINUS': '-', 'TIMES': '*',
+    'DIVIDE': '/', 'LT': '<', 'GT': '>', 'EQ': '=', 'LE': '<=', 'GE': '>=',
+    'LSQUARE': '[', 'RSQUARE': ']', 'DOTDOT': '..'
+}
+# parser.tokens is a tuple; test membership against a set instead.
+TOKEN_TYPES = frozenset(parser_tokens)
+ACTIVE_DELIMITER_TYPE_TO_SYMBOL = {
+    k: v for k, v in DELIMITER_TYPE_TO_SYMBOL.items() if k in TOKEN_TYPES
+}
+SORTED_DELIMITER_SYMBOLS = sorted(set(ACTIVE_DELIMITER_TYPE_TO_SYMBOL.values()))
+DELIMITER_SYMBOL_TO_POS = {sym: i + 1 for i, sym in enumerate(SORTED_DELIMITER_SYMBOLS)}
+
+# Token type -> formatted "(pos,type_code)" entry for keywords and delimiters.
+# The lexer already assigns reserved words their own token type, so classifying
+# a token only needs one lookup on token.type.
+STATIC_TOKEN_CODES = {
+    kw_type: f"({KEYWORD_TO_POS[kw]},k)" for kw, kw_type in parser_reserved.items()
+}
+STATIC_TOKEN_CODES.update({
+    delim_type: f"({DELIMITER_SYMBOL_TO_POS[sym]},d)"
+    for delim_type, sym in ACTIVE_DELIMITER_TYPE_TO_SYMBOL.items()
+})
+
+# The keyword and delimiter tables are identical for every program.
+KEYWORD_TABLE_STR = format_keyword_table(parser_reserved)
+DELIMITER_TABLE_STR = format_delimiter_table(DELIMITER_TYPE_TO_SYMBOL, TOKEN_TYPES)
+
+# Token types listed in the constant table.
+CONSTANT_TOKEN_TYPES = ('NUMBER', 'REAL_NUMBER', 'STRING')
+
+
+def collect_identifiers_and_constants(tokens):
+    """
+    Returns the alphabetically sorted (identifiers, constants) of a token list.
+    Both are collected in a single pass; token values are always the matched
+    source text, so no str() conversion is needed.
+    """
+    identifier_values = set()
+    constant_values = set()
+    for token_obj in tokens:
+        token_type = token_obj.type
+        if token_type == 'ID':
+            identifier_values.add(token_obj.value)
+        elif token_type in CONSTANT_TOKEN_TYPES:
+            constant_values.add(token_obj.value)
+    return sorted(identifier_values), sorted(constant_values)
+
+
+def transform_token_sequence(tokens, identifiers, constants):
+    """Maps each token to its "(pos,type_code)" entry, or "(err:TYPE,value)" if it has none."""
+    # Entries are formatted once per distinct value rather than once per token.
+    identifier_to_code = {ident: f"({i + 1},i)" for i, ident in enumerate(identifiers)}
+    constant_to_code = {const_val: f"({i + 1},c)" for i, const_val in enumerate(constants)}
+
+    # Token type -> value-to-code map for the program-specific tables.
+    dynamic_token_codes = {'ID': identifier_to_code}
+    dynamic_token_codes.update(dict.fromkeys(CONSTANT_TOKEN_TYPES, constant_to_code))
+
+    sequence = []
+    for token_obj in tokens:
+        token_type = token_obj.type
+        code = STATIC_TOKEN_CODES.get(token_type)
+        if code is None:
+            value_to_code = dynamic_token_codes.get(token_type)
+            if value_to_code is not None:
+                code = value_to_code[token_obj.value]
+            else:
+                # Fallback for unmapped tokens
+                code = f"(err:{token_type},{token_obj.value})"
+        sequence.append(code)
+    return sequence
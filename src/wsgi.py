@@ -0,0 +1,6 @@
+# WSGI entry point for production servers, e.g.:
+#   gunicorn --chdir src -w $(nproc) --preload -b 0.0.0.0:5000 wsgi:app
+# The modules in src/ import each other by bare name, hence --chdir src.
+from api import app
+
+__all__ = ['app']
@@ -0,0 +1,102 @@
+import json
+import time
+import pytest
+from src.api import app, _compile_cached, MAX_PROGRAM_SIZE
+
+PROGRAM = """
+program test;
+var x: integer;
+begin
+    x := 5;
+    if x > 0 then
+    begin
+        x := x - 1;
+    end;
+end.
+"""
+
+@pytest.fixture
+def client():
+    _compile_cached.cache_clear()
+    return app.test_client()
+
+def test_compile_returns_all_sections(client):
+    """Test that a valid program produces every result section."""
+    response = client.post('/compile', json={'program': PROGRAM})
+    assert response.status_code == 200
+    data = response.get_json()
+    for key in ('tokens', 'keywordTable', 'delimiterTable', 'identifierTable', 'constantTable',
+                'symbolTable', 'intermediate', 'optimizedIntermediate', 'typel', 'pfinfl', 'ainfl', 'consl'):
+        assert key in data, f"Missing section '{key}'"
+    assert "(=, 5, _, x)" in data['intermediate']
+
+def test_compile_reuses_cached_result(client):
+    """Test that resubmitting the same program is served from the cache."""
+    first = client.post('/compile', json={'program': PROGRAM})
+    second = client.post('/compile', json={'program': PROGRAM})
+    assert first.get_json() == second.get_json()
+    assert _compile_cached.cache_info().hits == 1
+
+def test_compile_syntax_error(client):
+    """Test that an invalid program is rejected with a 400 response."""
+    response = client.post('/compile', json={'program': 'program x; begin x := ; end.'})
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+def test_compile_streams_ndjson_sections(client):
+    """Test that NDJSON clients receive one line per section with the same content."""
+    response = client.post('/compile', json={'program': PROGRAM}, headers={'Accept': 'application/x-ndjson'})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]['phase'] == 'tokens'
+    streamed = {line['phase']: line['data'] for line in lines}
+    assert streamed == client.post('/compile', json={'program': PROGRAM}).get_json()
+
+def test_compile_nocache_bypasses_cache(client):
+    """Test that ?nocache=1 recompiles instead of reading or filling the cache."""
+    response = client.post('/compile?nocache=1', json={'program': PROGRAM})
+    assert response.status_code == 200
+    assert _compile_cached.cache_info().currsize == 0
+
+def test_compile_missing_program(client):
+    """Test that a request without a program is rejected with a JSON 400 response."""
+    response = client.post('/compile', json={})
+    assert response.status_code == 400
+    assert 'No program provided' in response.get_json()['error']
+
+def test_compile_cors_preflight(client):
+    """Test that preflights are answered with the static CORS policy, echoing the origin."""
+    response = client.options('/compile', headers={
+        'Origin': 'http://localhost:8000',
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'Content-Type',
+    })
+    assert response.status_code == 200
+    assert response.headers['Access-Control-Allow-Origin'] == 'http://localhost:8000'
+    assert response.headers['Access-Control-Allow-Credentials'] == 'true'
+    assert 'POST' in response.headers['Access-Control-Allow-Methods']
+    assert response.headers['Access-Control-Allow-Headers'] == 'Content-Type'
+
+def test_compile_rejects_oversized_program(client):
+    """Test that programs over the size limit are refused with 413 before compiling."""
+    program = PROGRAM + ' ' * MAX_PROGRAM_SIZE
+    response = client.post('/compile', json={'program': program})
+    assert response.status_code == 413
+    assert _compile_cached.cache_info().currsize == 0
+
+def test_compile_rejects_input_without_program_structure(client):
+    """Test that input lacking program/begin/end is rejected without running the pipeline."""
+    response = client.post('/compile', json={'program': 'x := 1;'})
+    assert response.status_code == 400
+    assert 'Invalid program syntax' in response.get_json()['error']
+    assert _compile_cached.cache_info().currsize == 0
+
+def test_compile_rejects_adversarial_structure_quickly(client):
+    """Test that repeated program/begin words without an end are rejected in linear time."""
+    program = ("program begin " * 15000)[:200 * 1024]
+    start = time.perf_counter()
+    response = client.post('/compile', json={'program': program})
+    assert time.perf_counter() - start < 2
+    assert response.status_code == 400
+    assert _compile_cached.cache_info().currsize == 0
@@ -0,0 +1,222 @@
+import pytest
+from src.intermediate import IntermediateCodeGenerator
+from src.optimizer import Optimizer
+
+def _undefined_temp_reads(code):
+    """Return the temps read by a quad before any earlier quad defines them."""
+    defined, undefined = set(), []
+    for op, arg1, arg2, res in code:
+        for arg in (arg1, arg2):
+            is_temp = isinstance(arg, str) and arg[:1] == 't' and arg[1:].isdigit()
+            if is_temp and arg not in defined:
+                undefined.append(arg)
+        defined.add(res)
+    return undefined
+
+def test_expression_temps_follow_evaluation_order():
+    """Test that operands are generated left to right before their operator."""
+    generator = IntermediateCodeGenerator()
+    expr = ('+', ('*', ('ID', 'a'), ('ID', 'b')), ('-', ('ID', 'c'), ('NUMBER', 1)))
+    assert generator.generate_expression(expr) == 't2'
+    assert generator.code == [
+        ('*', 'a', 'b', 't0'),
+        ('-', 'c', 1, 't1'),
+        ('+', 't0', 't1', 't2'),
+    ]
+
+def test_deeply_nested_expression():
+    """Test that expressions nested deeper than the recursion limit are generated."""
+    generator = IntermediateCodeGenerator()
+    expr = ('ID', 'x')
+    for _ in range(5000):
+        expr = ('+', expr, ('NUMBER', 1))
+    assert generator.generate_expression(expr) == 't4999'
+    assert len(generator.code) == 5000
+
+def test_unsupported_expression_error():
+    """Test error on an expression node the generator does not know."""
+    generator = IntermediateCodeGenerator()
+    with pytest.raises(ValueError, match="Unsupported expression type or structure"):
+        generator.generate_expression(('+', ('ID', 'x'), ('call', 'f')))
+
+def test_common_subexpressions_share_a_temp():
+    """Test that a repeated subexpression, in either operand order, reuses its temp."""
+    generator = IntermediateCodeGenerator()
+    a_plus_b = ('+', ('ID', 'a'), ('ID', 'b'))
+    b_plus_a = ('+', ('ID', 'b'), ('ID', 'a'))
+    assert generator.generate_expression(('*', a_plus_b, b_plus_a)) == 't1'
+    assert generator.code == [('+', 'a', 'b', 't0'), ('*', 't0', 't0', 't1')]
+
+def test_assignment_invalidates_cached_subexpressions():
+    """Test that assigning an operand forces the subexpression to be recomputed."""
+    generator = IntermediateCodeGenerator()
+    a_plus_b = ('+', ('ID', 'a'), ('ID', 'b'))
+    generator.generate_statements([
+        ('assign', ('ID', 'x'), a_plus_b),
+        ('assign', ('ID', 'a'), ('NUMBER', 7)),
+        ('assign', ('ID', 'y'), a_plus_b),
+    ])
+    assert generator.code == [
+        ('+', 'a', 'b', 't0'),
+        ('=', 't0', '_', 'x'),
+        ('=', 7, '_', 'a'),
+        ('+', 'a', 'b', 't1'),
+        ('=', 't1', '_', 'y'),
+    ]
+
+def test_subexpressions_are_not_reused_across_blocks():
+    """Test that a value computed before a loop is recomputed inside it."""
+    generator = IntermediateCodeGenerator()
+    a_plus_b = ('+', ('ID', 'a'), ('ID', 'b'))
+    generator.generate_statements([
+        ('assign', ('ID', 'x'), a_plus_b),
+        ('while', ('<', ('ID', 'x'), ('NUMBER', 9)), [('assign', ('ID', 'x'), a_plus_b)]),
+    ])
+    assert [quad for quad in generator.code if quad[0] == '+'] == [('+', 'a', 'b', 't0'), ('+', 'a', 'b', 't0')]
+
+def test_generated_names_are_shared_across_runs():
+    """Test that temp and label names are formatted once and reused by later runs."""
+    generator = IntermediateCodeGenerator()
+    ast = ('program', 'p', [], [('while', ('<', ('ID', 'x'), ('NUMBER', 3)), [('assign', ('ID', 'x'), ('+', ('ID', 'x'), ('NUMBER', 1)))])])
+    first = list(generator.generate(ast))
+    second = generator.generate(ast)
+    assert first == second
+    assert all(a[3] is b[3] for a, b in zip(first, second))
+
+def test_constant_expressions_are_folded():
+    """Test that operations on constants are evaluated with the optimizer's semantics."""
+    generator = IntermediateCodeGenerator()
+    assert generator.generate_expression(('*', ('+', ('NUMBER', 2), ('NUMBER', 3)), ('NUMBER', 4))) == 20
+    assert generator.generate_expression(('/', ('NUMBER', 7), ('NUMBER', 2))) == 3
+    assert generator.generate_expression(('<', ('NUMBER', 1), ('REAL_NUMBER', 1.5))) is True
+    assert generator.code == []
+
+def test_division_by_constant_zero_is_not_folded():
+    """Test that a constant division by zero is left for run time."""
+    generator = IntermediateCodeGenerator()
+    assert generator.generate_expression(('/', ('NUMBER', 1), ('NUMBER', 0))) == 't0'
+    assert generator.code == [('/', 1, 0, 't0')]
+
+def test_constant_conditions_drop_dead_branches():
+    """Test that if/while statements with folded conditions only generate reachable code."""
+    generator = IntermediateCodeGenerator()
+    generator.generate_statements([
+        ('if', ('>', ('NUMBER', 2), ('NUMBER', 1)), [('assign', ('ID', 'x'), ('NUMBER', 1))], [('assign', ('ID', 'x'), ('NUMBER', 2))]),
+        ('if', ('>', ('NUMBER', 1), ('NUMBER', 2)), [('assign', ('ID', 'y'), ('NUMBER', 1))], None),
+        ('while', ('=', ('NUMBER', 1), ('NUMBER', 2)), [('assign', ('ID', 'z'), ('NUMBER', 1))]),
+    ])
+    assert generator.code == [('=', 1, '_', 'x')]
+    assert generator.label_count == 0
+
+def test_temps_are_recycled_across_blocks():
+    """Test that each basic block numbers its temps from t0 again."""
+    generator = IntermediateCodeGenerator()
+    generator.generate_statements([
+        ('assign', ('ID', 'x'), ('*', ('+', ('ID', 'a'), ('NUMBER', 1)), ('ID', 'b'))),
+        ('if', ('<', ('ID', 'x'), ('NUMBER', 9)), [('assign', ('ID', 'y'), ('-', ('ID', 'x'), ('NUMBER', 1)))], None),
+    ])
+    assert generator.code == [
+        ('+', 'a', 1, 't0'),
+        ('*', 't0', 'b', 't1'),
+        ('=', 't1', '_', 'x'),
+        ('<', 'x', 9, 't2'),
+        ('if', 't2', '_', 'L0'),
+        ('-', 'x', 1, 't0'),
+        ('=', 't0', '_', 'y'),
+        ('ie', '_', '_', 'L0'),
+    ]
+
+def test_recycled_temps_survive_optimization():
+    """Test that a temp reused after an if statement does not clobber the one inside it."""
+    generator = IntermediateCodeGenerator()
+    generator.generate_statements([
+        ('if', ('>', ('ID', 'c'), ('NUMBER', 0)), [('assign', ('ID', 'y'), ('*', ('+', ('ID', 'a'), ('NUMBER', 1)), ('NUMBER', 2)))], None),
+        ('assign', ('ID', 'z'), ('+', ('ID', 'b'), ('NUMBER', 3))),
+    ])
+    optimized = Optimizer().optimize(generator.code)
+    assert optimized == [
+        ('>', 'c', 0, 't0'),
+        ('if', 't0', '_', 'L0'),
+        ('+', 'a', 1, 't0'),
+        ('*', 't0', 2, 'y'),
+        ('ie', '_', '_', 'L0'),
+        ('+', 'b', 3, 'z'),
+    ]
+    assert _undefined_temp_reads(optimized) == []
+
+def test_and_conditions_short_circuit():
+    """Test that each operand of an 'and' condition jumps to the false branch on its own."""
+    generator = IntermediateCodeGenerator()
+    cond = ('and', ('and', ('>', ('ID', 'x'), ('NUMBER', 0)), ('<', ('NUMBER', 1), ('NUMBER', 2))), ('ID', 'ok'))
+    generator.generate_statements([
+        ('if', cond, [('assign', ('ID', 'y'), ('NUMBER', 1))], [('assign', ('ID', 'y'), ('NUMBER', 2))]),
+    ])
+    assert generator.code == [
+        ('>', 'x', 0, 't0'),
+        ('if', 't0', '_', 'L1'),
+        ('if', 'ok', '_', 'L1'),
+        ('=', 1, '_', 'y'),
+        ('el', '_', '_', 'L0'),
+        ('lb', '_', '_', 'L1'),
+        ('=', 2, '_', 'y'),
+        ('ie', '_', '_', 'L0'),
+    ]
+    assert not any(quad[0] == 'and' for quad in generator.code)
+
+def test_loop_invariants_are_hoisted():
+    """Test that subexpressions a while loop never changes are computed once before it."""
+    generator = IntermediateCodeGenerator()
+    generator.generate_statements([
+        ('while', ('<', ('ID', 'i'), ('-', ('ID', 'n'), ('NUMBER', 1))), [
+            ('assign', ('ID', 'i'), ('+', ('ID', 'i'), ('*', ('ID', 'n'), ('NUMBER', 2)))),
+            ('if', ('>', ('ID', 'i'), ('NUMBER', 5)), [('writeln', [('*', ('ID', 'n'), ('NUMBER', 2))])], None),
+        ]),
+    ])
+    assert generator.code == [
+        ('wh', '_', '_', '_'),
+        ('-', 'n', 1, 't0'),
+        ('*', 'n', 2, 't1'),
+        ('lb', '_', '_', 'L0'),
+        ('<', 'i', 't0', 't2'),
+        ('do', 't2', '_', 'L1'),
+        ('+', 'i', 't1', 't2'),
+        ('=', 't2', '_', 'i'),
+        ('>', 'i', 5, 't3'),
+        ('if', 't3', '_', 'L2'),
+        ('write', 't1', '_', '_'),
+        ('ie', '_', '_', 'L2'),
+        ('we', '_', '_', 'L0'),
+        ('lb', '_', '_', 'L1'),
+    ]
+
+def test_hoisted_temps_survive_an_if_in_the_loop_body():
+    """Test that hoisted and recycled temps stay defined after optimizing a loop containing an if."""
+    generator = IntermediateCodeGenerator()
+    generator.generate_statements([
+        ('while', ('<', ('ID', 'i'), ('-', ('ID', 'n'), ('NUMBER', 1))), [
+            ('if', ('>', ('ID', 'i'), ('NUMBER', 5)), [
+                ('assign', ('ID', 'y'), ('*', ('+', ('ID', 'y'), ('NUMBER', 1)), ('*', ('ID', 'n'), ('NUMBER', 2)))),
+            ], None),
+            ('assign', ('ID', 'i'), ('+', ('ID', 'i'), ('*', ('ID', 'n'), ('NUMBER', 2)))),
+        ]),
+        ('assign', ('ID', 'z'), ('+', ('ID', 'b'), ('NUMBER', 3))),
+    ])
+    optimized = Optimizer().optimize(generator.code)
+    assert optimized == [
+        ('wh', '_', '_', '_'),
+        ('-', 'n', 1, 't0'),
+        ('*', 'n', 2, 't1'),
+        ('lb', '_', '_', 'L0'),
+        ('<', 'i', 't0', 't2'),
+        ('do', 't2', '_', 'L1'),
+        ('>', 'i', 5, 't2'),
+        ('if', 't2', '_', 'L2'),
+        ('+', 'y', 1, 't2'),
+        ('*', 't2', 't1', 'y'),
+        ('ie', '_', '_', 'L2'),
+        ('+', 'i', 't1', 'i'),
+        ('we', '_', '_', 'L0'),
+        ('lb', '_', '_', 'L1'),
+        ('+', 'b', 3, 'z'),
+    ]
+    assert _undefined_temp_reads(optimized) == []
@@ -0,0 +1,32 @@
+from src.optimizer import Optimizer
+
+def test_straight_line_code_is_one_block():
+    """Test that code without control flow forms a single basic block."""
+    code = [('+', 'a', 1, 't0'), ('=', 't0', '_', 'x'), ('write', 'x', '_', '_')]
+    assert Optimizer()._identify_basic_blocks(code) == [code]
+
+def test_blocks_split_at_labels_and_jumps():
+    """Test that labels and the instructions after jumps start new basic blocks."""
+    code = [
+        ('=', 1, '_', 'x'),
+        ('wh', '_', '_', '_'),
+        ('lb', '_', '_', 'L0'),
+        ('<', 'x', 3, 't0'),
+        ('do', 't0', '_', 'L1'),
+        ('+', 'x', 1, 't1'),
+        ('=', 't1', '_', 'x'),
+        ('we', '_', '_', 'L0'),
+        ('lb', '_', '_', 'L1'),
+    ]
+    blocks = Optimizer()._identify_basic_blocks(code)
+    assert blocks == [code[0:1], code[1:2], code[2:5], code[5:8], code[8:9]]
+
+def test_constant_expression_is_folded():
+    """Test that an expression over constants is folded into the assignment."""
+    optimized = Optimizer().optimize([('*', 2, 3, 't0'), ('=', 't0', '_', 'x')])
+    assert optimized == [('=', 6, '_', 'x')]
+
+def test_division_by_zero_is_not_folded():
+    """Test that a constant division by zero is left for run time while other operators fold."""
+    optimized = Optimizer().optimize([('/', 7, 2, 't0'), ('=', 't0', '_', 'x'), ('/', 1, 0, 't1'), ('=', 't1', '_', 'y')])
+    assert optimized == [('/', 1, 0, 'y'), ('=', 3, '_', 'x')]
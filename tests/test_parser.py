@@ -1,5 +1,5 @@
 import pytest
-from src.parser import parse, lexer
+from src.parser import parse, lexer, PARSETAB_PICKLE, _discard_truncated_parsetab
 
 def test_lexer_tokens():
     """Test lexer token recognition for various input strings."""
@@ -72,3 +72,47 @@ def test_parser_while_statement():
     assert ast is not None, "Parsing failed for while statement"
     assert ast[3][0][0] == 'while', "Statement should be a 'while'"
     assert len(ast[3][0][2]) == 2, "While body should have two elements including semicolon"
+
+def test_parse_lexes_each_input_from_line_one():
+    """Test that parse() returns its tokens and restarts line numbering on every call."""
+    input_str = "program test;\nbegin\nx := 1;\nend."
+    first_tokens, first_ast = parse(input_str)
+    second_tokens, second_ast = parse(input_str)
+    assert first_ast is not None and first_ast == second_ast
+    assert [tok.type for tok in second_tokens] == ["PROGRAM", "ID", "SEMICOLON", "BEGIN",
+                                                   "ID", "ASSIGN", "NUMBER", "SEMICOLON", "END", "DOT"]
+    assert [tok.lineno for tok in first_tokens] == [tok.lineno for tok in second_tokens]
+    assert second_tokens[-1].lineno == 4
+
+def test_parse_is_thread_safe():
+    """Test that concurrent parse() calls from several threads do not interfere."""
+    from concurrent.futures import ThreadPoolExecutor
+    programs = [f"program p{i};\nvar x: integer;\nbegin\nx := {i} + 1;\nend." for i in range(40)]
+    expected = [parse(program) for program in programs]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse, programs))
+    for (tokens, ast), (expected_tokens, expected_ast) in zip(results, expected):
+        assert ast == expected_ast
+        assert [(tok.type, tok.value, tok.lineno) for tok in tokens] == \
+               [(tok.type, tok.value, tok.lineno) for tok in expected_tokens]
+
+def test_crlf_line_endings():
+    """Test that CRLF line endings lex like LF ones."""
+    lf_source = "program test;\nvar x: integer;\nbegin\n    x := 5\nend."
+    lf_tokens, lf_ast = parse(lf_source)
+    crlf_tokens, crlf_ast = parse(lf_source.replace("\n", "\r\n"))
+    assert crlf_ast == lf_ast
+    assert [(t.type, t.value, t.lineno) for t in crlf_tokens] == [(t.type, t.value, t.lineno) for t in lf_tokens]
+
+def test_truncated_parsetab_is_discarded(tmp_path):
+    """Test that a truncated table cache is deleted so PLY regenerates it, and a complete one is kept."""
+    with open(PARSETAB_PICKLE, 'rb') as f:
+        tables = f.read()
+    complete, truncated = tmp_path / "complete.pickle", tmp_path / "truncated.pickle"
+    complete.write_bytes(tables)
+    truncated.write_bytes(tables[:3000])
+    _discard_truncated_parsetab(str(complete))
+    _discard_truncated_parsetab(str(truncated))
+    _discard_truncated_parsetab(str(tmp_path / "missing.pickle"))
+    assert complete.exists()
+    assert not truncated.exists()
@@ -236,4 +236,39 @@ def test_semantic_analysis_if_condition_type():
             assert analyzer.lookup_symbol('a_var') is None # a_var from sibling scope should not be visible
             analyzer.exit_scope() # Exit Block B
 
-            assert analyzer.lookup_symbol('b_var') is None
\ No newline at end of file
+            assert analyzer.lookup_symbol('b_var') is None
+
+
+def test_reset_allows_reusing_analyzer():
+    """Test that reset() clears the tables so one analyzer can analyze several programs."""
+    input_str = """
+    program test;
+    var x: integer;
+    begin
+        x := 5;
+    end.
+    """
+    _, ast = parse(input_str)
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    first_snapshot = analyzer.get_symbol_tables_snapshot()
+    analyzer.reset()
+    analyzer.analyze(ast)
+    assert analyzer.get_symbol_tables_snapshot() == first_snapshot
+
+def test_type_names_are_recomputed_after_reset():
+    """Test that cached type names do not leak from one program into the next."""
+    template = """
+    program test;
+    var a: array[1..3] of {};
+    begin
+        a[1] := 1;
+    end.
+    """
+    analyzer = SemanticAnalyzer()
+    for element_type in ('integer', 'real'):
+        _, ast = parse(template.format(element_type))
+        analyzer.reset()
+        analyzer.analyze(ast)
+        array_ptr = len(analyzer.typel) - 1
+        assert analyzer.get_type_name_from_ptr(array_ptr) == f"ARRAY OF {element_type.upper()}"